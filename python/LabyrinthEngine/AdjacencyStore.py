@@ -0,0 +1,161 @@
+# AdjacencyStore.py
+
+# Stores the connections between the rooms of a labyrinth.
+
+# A room can only ever be connected to one of its "possible neighbours" on the adjacent levels (see PossibleNeighbours),
+# so the connections of each room are stored as a bitset over its list of possible neighbours: bit i is set if the room is connected to
+# its i-th possible neighbour.  Testing, making and removing a connection are O(1), and the neighbours of a room are always listed in
+# the order of its possible neighbours, whatever the order in which the connections were made.
+
+# The version number is incremented every time a connection is made or removed, so that anything derived from the connections
+# (such as a DistanceOracle) can tell whether it is out of date.
+
+# CompactAdjacency is a read-only counterpart of AdjacencyStore, for labyrinths that are no longer being generated.
+
+from array import array
+from .PossibleNeighbours import GetPossibleNeighbourTable
+
+class AdjacencyStore:
+	def __init__(self, numberOfLevels, numberOfRoomsPerLevel):
+		self.numberOfLevels = numberOfLevels
+		self.numberOfRoomsPerLevel = numberOfRoomsPerLevel
+		self.numberOfRooms = numberOfLevels * numberOfRoomsPerLevel
+		self.hubRoomNumber = numberOfRoomsPerLevel - 1
+		self.bitsets = [0] * self.numberOfRooms
+		self.possibleNeighbours = GetPossibleNeighbourTable(numberOfLevels, numberOfRoomsPerLevel)
+		self.version = 0
+
+	def GetBit(self, room1, room2):
+		# Return the position of room2 in room1's list of possible neighbours, or -1 if room2 is not a possible neighbour of room1.
+		# room2 may lie outside of the labyrinth (e.g. on level -1).
+		levelNumber1, roomNumber1 = divmod(room1, self.numberOfRoomsPerLevel)
+		levelNumber2, roomNumber2 = divmod(room2, self.numberOfRoomsPerLevel)
+		hubRoomNumber = self.hubRoomNumber
+
+		if roomNumber1 == hubRoomNumber:
+
+			if roomNumber2 == hubRoomNumber:
+				return -1
+
+			numberOfBitsPerLevel = hubRoomNumber
+			bit = roomNumber2
+		else:
+			numberOfBitsPerLevel = 3
+
+			if roomNumber2 == (roomNumber1 + 1) % hubRoomNumber:
+				bit = 0
+			elif roomNumber2 == (roomNumber1 + hubRoomNumber - 1) % hubRoomNumber:
+				bit = 1
+			elif roomNumber2 == hubRoomNumber:
+				bit = 2
+			else:
+				return -1
+
+		if levelNumber2 == levelNumber1 - 1 and levelNumber1 > 0:
+			return bit
+		elif levelNumber2 == levelNumber1 + 1 and levelNumber2 < self.numberOfLevels:
+
+			if levelNumber1 > 0:
+				bit += numberOfBitsPerLevel
+
+			return bit
+		else:
+			return -1
+
+	def GetPossibleNeighbour(self, room, bit):
+		# The inverse of GetBit().
+		return self.possibleNeighbours.GetPossibleNeighbour(room, bit)
+
+	def AreConnected(self, room1, room2):
+		bit = self.GetBit(room1, room2)
+
+		return bit >= 0 and (self.bitsets[room1] >> bit) & 1 == 1
+
+	def Connect(self, room1, room2):
+		bit1 = self.GetBit(room1, room2)
+		bit2 = self.GetBit(room2, room1)
+
+		if bit1 < 0 or bit2 < 0:
+			raise Exception('AdjacencyStore.Connect(): The rooms are not possible neighbours.')
+
+		self.bitsets[room1] |= 1 << bit1
+		self.bitsets[room2] |= 1 << bit2
+		self.version += 1
+
+	def Disconnect(self, room1, room2):
+		bit1 = self.GetBit(room1, room2)
+		bit2 = self.GetBit(room2, room1)
+
+		if bit1 >= 0:
+			self.bitsets[room1] &= ~(1 << bit1)
+
+		if bit2 >= 0:
+			self.bitsets[room2] &= ~(1 << bit2)
+
+		self.version += 1
+
+	def Degree(self, room):
+		return bin(self.bitsets[room]).count('1')
+
+	def Neighbours(self, room):
+		bitset = self.bitsets[room]
+		result = []
+
+		while bitset != 0:
+			lowestBit = bitset & -bitset
+			result.append(self.GetPossibleNeighbour(room, lowestBit.bit_length() - 1))
+			bitset ^= lowestBit
+
+		return result
+
+	def Edges(self):
+		# Generate each connection once, as a (room1, room2) tuple with room1 < room2.
+
+		for room1 in range(0, self.numberOfRooms):
+
+			for room2 in self.Neighbours(room1):
+
+				if room1 < room2:
+					yield (room1, room2)
+
+	def ToCompactArrays(self):
+		# Return the connections in compressed sparse row form, as an (offsets, targets) tuple of arrays (see CompactAdjacency).
+		offsets = array('I', [0])
+		targets = array('I')
+
+		for room in range(0, self.numberOfRooms):
+			targets.extend(self.Neighbours(room))
+			offsets.append(len(targets))
+
+		return (offsets, targets)
+
+class CompactAdjacency:
+	# The connections in compressed sparse row form: the neighbours of room r are targets[offsets[r]:offsets[r + 1]].
+	# offsets and targets may be arrays or memoryviews (e.g. of a memory-mapped file); they are never copied.
+
+	def __init__(self, numberOfLevels, numberOfRoomsPerLevel, offsets, targets):
+		self.numberOfLevels = numberOfLevels
+		self.numberOfRoomsPerLevel = numberOfRoomsPerLevel
+		self.numberOfRooms = numberOfLevels * numberOfRoomsPerLevel
+		self.offsets = offsets
+		self.targets = targets
+		self.version = 0	# The connections never change.
+
+	def AreConnected(self, room1, room2):
+		return room1 >= 0 and room1 < self.numberOfRooms and room2 in self.Neighbours(room1)
+
+	def Degree(self, room):
+		return self.offsets[room + 1] - self.offsets[room]
+
+	def Neighbours(self, room):
+		return self.targets[self.offsets[room]:self.offsets[room + 1]]
+
+	def Edges(self):
+		# Generate each connection once, as a (room1, room2) tuple with room1 < room2.
+
+		for room1 in range(0, self.numberOfRooms):
+
+			for room2 in self.Neighbours(room1):
+
+				if room1 < room2:
+					yield (room1, room2)
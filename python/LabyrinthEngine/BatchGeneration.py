@@ -0,0 +1,94 @@
+# BatchGeneration.py
+
+# Generates many labyrinths without any interaction, spreading the jobs over a pool of worker processes.
+# Each job gets its own seed, derived from the base seed and the job number, so any labyrinth in a batch can be regenerated by itself.
+# Each labyrinth is written to the output file as soon as it is finished, as one line of JSON (the "JSON Lines" format);
+# the lines are therefore in order of completion, not in order of job number.
+# If a binary directory is given, each worker saves its labyrinth there as a labyrinth file (see LabyrinthFile),
+# and the line of JSON only records the job number, the seed and the path of the file.
+
+# Usage: python3 -m LabyrinthEngine.BatchGeneration --count 10000 --levels 15 --rooms 7 --seed 42 --output labyrinths.jsonl [--binary-directory levels]
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import sys
+import time
+from . import LabyrinthFile
+from .Labyrinth import LabyrinthGenerator
+from .Reporting import QuietReporter
+
+def DeriveJobSeed(baseSeed, jobNumber):
+	digest = hashlib.sha256((str(baseSeed) + ':' + str(jobNumber)).encode('ascii')).digest()
+	return int.from_bytes(digest[:8], 'little')
+
+def GenerateJob(numberOfLevels, numberOfRoomsPerLevel, jobNumber, seed, binaryDirectory = None):
+	# This runs in a worker process.
+	generator = LabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, QuietReporter(), seed)
+	generator.Generate()
+
+	if binaryDirectory != None:
+		path = os.path.join(binaryDirectory, 'labyrinth-' + str(jobNumber) + '.lbyr')
+		LabyrinthFile.SaveLabyrinth(generator, path, seed)
+		return {'job': jobNumber, 'seed': seed, 'path': path}
+
+	result = {'job': jobNumber}
+	result.update(LabyrinthFile.LabyrinthToDictionary(generator, seed))
+	return result
+
+def GenerateBatch(numberOfLabyrinths, numberOfLevels, numberOfRoomsPerLevel, outputFile, baseSeed = 0, numberOfWorkers = None, binaryDirectory = None):
+	# Return the number of labyrinths written to outputFile (an open text file).
+	# Only a few jobs per worker are submitted at a time, so that finished labyrinths do not pile up in memory.
+
+	if numberOfWorkers == None:
+		numberOfWorkers = os.cpu_count() or 1
+
+	maximumNumberOfPendingJobs = 2 * numberOfWorkers
+	nextJobNumber = 0
+	numberOfLabyrinthsWritten = 0
+	pendingJobs = set()
+
+	with concurrent.futures.ProcessPoolExecutor(numberOfWorkers) as executor:
+
+		while nextJobNumber < numberOfLabyrinths or len(pendingJobs) > 0:
+
+			while nextJobNumber < numberOfLabyrinths and len(pendingJobs) < maximumNumberOfPendingJobs:
+				seed = DeriveJobSeed(baseSeed, nextJobNumber)
+				pendingJobs.add(executor.submit(GenerateJob, numberOfLevels, numberOfRoomsPerLevel, nextJobNumber, seed, binaryDirectory))
+				nextJobNumber += 1
+
+			finishedJobs, pendingJobs = concurrent.futures.wait(pendingJobs, return_when = concurrent.futures.FIRST_COMPLETED)
+
+			for job in finishedJobs:
+				outputFile.write(json.dumps(job.result()) + '\n')
+				numberOfLabyrinthsWritten += 1
+
+			outputFile.flush()
+
+	return numberOfLabyrinthsWritten
+
+def main():
+	parser = argparse.ArgumentParser(description = 'Generate labyrinths in a batch, without any interaction.')
+	parser.add_argument('--count', type = int, required = True, help = 'the number of labyrinths to generate')
+	parser.add_argument('--levels', type = int, default = 15, help = 'the number of levels in each labyrinth')
+	parser.add_argument('--rooms', type = int, default = 7, help = 'the number of rooms per level')
+	parser.add_argument('--seed', type = int, default = 0, help = 'the base seed from which the seed of each job is derived')
+	parser.add_argument('--workers', type = int, default = None, help = 'the number of worker processes (default: the number of CPUs)')
+	parser.add_argument('--output', required = True, help = 'the JSON Lines file to write')
+	parser.add_argument('--binary-directory', default = None, help = 'save each labyrinth as a labyrinth file in this directory')
+	args = parser.parse_args()
+
+	startTime = time.time()
+
+	if args.binary_directory != None and not os.path.isdir(args.binary_directory):
+		os.makedirs(args.binary_directory)
+
+	with open(args.output, 'w') as outputFile:
+		numberOfLabyrinthsWritten = GenerateBatch(args.count, args.levels, args.rooms, outputFile, args.seed, args.workers, args.binary_directory)
+
+	sys.stderr.write('Generated ' + str(numberOfLabyrinthsWritten) + ' labyrinth(s) in ' + str(round(time.time() - startTime, 2)) + ' seconds.\n')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,270 @@
+# Benchmarks.py
+
+# Times the generator, the path finding and a scripted game over a grid of labyrinth sizes, with fixed seeds,
+# so that the effect of a change can be measured.  For each benchmark and size, the results are the median, the 95th percentile
+# and the maximum of the times (in seconds) over all seeds and repetitions, and the peak memory allocated (in bytes, as measured
+# by tracemalloc in a separate, untimed run, since tracing slows everything down).
+# The results are written as JSON; a previous run's JSON can be passed with --compare to print the change in each median.
+# The Refactor benchmark times each call of LabyrinthGenerator.Refactor() separately, so its samples are the times of single repairs.
+# A repair costs time in proportion to the smaller of the two parts of each blob that it splits (see LabyrinthGenerator.DetachSmallerPart()),
+# and now and then it also pays for an O(n) DisjointSet.Compact(); so, over a wide range of sizes
+# (e.g. --benchmarks Refactor --sizes 30x30,100x100,300x100,1000x100), the median stays about the same, but the 95th percentile
+# and the maximum grow with the number of rooms.
+
+# Usage: python3 -m LabyrinthEngine.Benchmarks [--sizes 15x7,30x30] [--seeds 1,2,3] [--repeats 5] [--output results.json] [--compare baseline.json]
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from . import VersionSpecificUtilities
+from .GenerationStats import Percentile
+from .Labyrinth import LabyrinthGenerator
+from .Reporting import QuietReporter
+
+defaultSizes = [(15, 7), (30, 15), (30, 30), (60, 30)]
+defaultSeeds = [1, 2, 3]
+numberOfPathQueries = 100
+numberOfMovesInScriptedGame = 200
+
+def CreateLabyrinth(numberOfLevels, numberOfRoomsPerLevel, seed):
+	generator = LabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, QuietReporter(), seed)
+	generator.Generate()
+	return generator
+
+# Each benchmark is a (name, setUp, run) tuple: setUp(numberOfLevels, numberOfRoomsPerLevel, seed) is not timed,
+# and returns the argument that is passed to run(), which is timed.  Each run must reseed the labyrinth's random number generator
+# if it uses it, so that every repetition does the same work.  If run() returns a list of times, those are the samples, instead of its own time.
+
+def SetUpGenerate(numberOfLevels, numberOfRoomsPerLevel, seed):
+	return (numberOfLevels, numberOfRoomsPerLevel, seed)
+
+def RunGenerate(arguments):
+	CreateLabyrinth(*arguments)
+
+def RunRefactor(arguments):
+	# Generate a labyrinth, and return the time taken by each refactoring (if any).
+	numberOfLevels, numberOfRoomsPerLevel, seed = arguments
+	generator = LabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, QuietReporter(), seed)
+	refactor = generator.Refactor
+	times = []
+
+	def TimedRefactor():
+		startTime = time.perf_counter()
+		refactor()
+		times.append(time.perf_counter() - startTime)
+
+	generator.Refactor = TimedRefactor
+	generator.Generate()
+	return times
+
+def SetUpFindShortestPath(numberOfLevels, numberOfRoomsPerLevel, seed):
+	generator = CreateLabyrinth(numberOfLevels, numberOfRoomsPerLevel, seed)
+	queryRandom = random.Random(seed)
+	queries = [(queryRandom.randrange(generator.numberOfRooms), queryRandom.randrange(generator.numberOfRooms)) for i in range(0, numberOfPathQueries)]
+	return (generator, queries)
+
+def RunFindShortestPath(arguments):
+	generator, queries = arguments
+
+	for room, roomGoal in queries:
+		generator.FindShortestPathBetweenRooms(room, roomGoal)
+
+def SetUpLabyrinth(numberOfLevels, numberOfRoomsPerLevel, seed):
+	return (CreateLabyrinth(numberOfLevels, numberOfRoomsPerLevel, seed), seed)
+
+def RunPrintLongestPath(arguments):
+	# The TreeAnalytics are discarded first, so that each run computes them again, as it does just after generation, rather than
+	# timing a lookup of the cached diameter.  The DistanceOracle is kept, since Generate() builds it before PrintLongestPath() is called.
+	generator, seed = arguments
+	generator.treeAnalytics = None
+	generator.PrintLongestPath()
+
+def RunTreeAnalytics(arguments):
+	# Build the DistanceOracle and the TreeAnalytics from the connections alone.
+	generator, seed = arguments
+	generator.distanceOracle = None
+	generator.treeAnalytics = None
+	generator.GetTreeAnalytics()
+
+def RunPlaceBooksInRooms(arguments):
+	generator, seed = arguments
+	generator.random.seed(seed)
+	generator.booksInRooms = {}
+	generator.PlaceBooksInRooms()
+
+def CreateScript(seed):
+	# A game of numberOfMovesInScriptedGame moves, with a request for help every tenth move, followed by "q".
+	scriptRandom = random.Random(seed)
+	script = []
+
+	for i in range(0, numberOfMovesInScriptedGame):
+
+		if i % 10 == 9:
+			script.append('h')
+		else:
+			script.append(str(scriptRandom.randint(0, 2)))
+
+	script.append('q')
+	return script
+
+def RunNavigateLabyrinth(arguments):
+	generator, seed = arguments
+	script = iter(CreateScript(seed))
+	originalInput = VersionSpecificUtilities.input
+	VersionSpecificUtilities.input = lambda prompt: next(script)
+	generator.random.seed(seed)
+
+	try:
+
+		with open(os.devnull, 'w') as devNull, contextlib.redirect_stdout(devNull):
+			generator.NavigateLabyrinth()
+	finally:
+		VersionSpecificUtilities.input = originalInput
+
+benchmarks = [
+	('Generate', SetUpGenerate, RunGenerate),
+	('Refactor', SetUpGenerate, RunRefactor),
+	('FindShortestPathBetweenRooms', SetUpFindShortestPath, RunFindShortestPath),
+	('PrintLongestPath', SetUpLabyrinth, RunPrintLongestPath),
+	('TreeAnalytics', SetUpLabyrinth, RunTreeAnalytics),
+	('PlaceBooksInRooms', SetUpLabyrinth, RunPlaceBooksInRooms),
+	('NavigateLabyrinth', SetUpLabyrinth, RunNavigateLabyrinth)
+]
+
+def MeasurePeakMemory(run, arguments):
+	tracemalloc.start()
+
+	try:
+		run(arguments)
+		return tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+
+def RunBenchmark(name, setUp, run, numberOfLevels, numberOfRoomsPerLevel, seeds, numberOfRepetitions):
+	times = []
+	peakMemory = 0
+
+	for seed in seeds:
+		arguments = setUp(numberOfLevels, numberOfRoomsPerLevel, seed)
+
+		for i in range(0, numberOfRepetitions):
+			startTime = time.perf_counter()
+			samples = run(arguments)
+			elapsedTime = time.perf_counter() - startTime
+
+			if samples == None:
+				times.append(elapsedTime)
+			else:
+				times.extend(samples)
+
+		peakMemory = max(peakMemory, MeasurePeakMemory(run, arguments))
+
+	if len(times) == 0:
+		return None	# E.g. no refactoring was needed.
+
+	times.sort()
+
+	return {
+		'benchmark': name,
+		'numberOfLevels': numberOfLevels,
+		'numberOfRoomsPerLevel': numberOfRoomsPerLevel,
+		'numberOfSamples': len(times),
+		'median': statistics.median(times),
+		'p95': Percentile(times, 95),
+		'max': times[-1],
+		'peakMemory': peakMemory
+	}
+
+def RunBenchmarks(sizes = defaultSizes, seeds = defaultSeeds, numberOfRepetitions = 5, names = None):
+	# Return the results as a dictionary that can be written as JSON.
+	results = []
+
+	for numberOfLevels, numberOfRoomsPerLevel in sizes:
+
+		for name, setUp, run in benchmarks:
+
+			if names == None or name in names:
+				result = RunBenchmark(name, setUp, run, numberOfLevels, numberOfRoomsPerLevel, seeds, numberOfRepetitions)
+
+				if result == None:
+					sys.stderr.write(name + ' ' + str(numberOfLevels) + 'x' + str(numberOfRoomsPerLevel) + ': no samples\n')
+					continue
+
+				results.append(result)
+				sys.stderr.write(name + ' ' + str(numberOfLevels) + 'x' + str(numberOfRoomsPerLevel) + ': median ' +
+					str(round(result['median'], 6)) + ' s, p95 ' + str(round(result['p95'], 6)) + ' s, max ' + str(round(result['max'], 6)) + ' s, peak ' +
+					str(result['peakMemory']) + ' bytes\n')
+
+	return {
+		'python': platform.python_version(),
+		'seeds': list(seeds),
+		'numberOfRepetitions': numberOfRepetitions,
+		'results': results
+	}
+
+def CompareResults(baseline, current):
+	# Return one line per benchmark and size found in both runs, giving the ratio of the current median to the baseline median.
+	baselineMedians = {}
+	lines = []
+
+	for result in baseline['results']:
+		baselineMedians[(result['benchmark'], result['numberOfLevels'], result['numberOfRoomsPerLevel'])] = result['median']
+
+	for result in current['results']:
+		key = (result['benchmark'], result['numberOfLevels'], result['numberOfRoomsPerLevel'])
+
+		if key in baselineMedians and baselineMedians[key] > 0:
+			lines.append(key[0] + ' ' + str(key[1]) + 'x' + str(key[2]) + ': ' + str(round(result['median'] / baselineMedians[key], 3)) + 'x the baseline median')
+
+	return lines
+
+def ParseSizes(text):
+	sizes = []
+
+	for size in text.split(','):
+		numberOfLevels, numberOfRoomsPerLevel = size.split('x')
+		sizes.append((int(numberOfLevels), int(numberOfRoomsPerLevel)))
+
+	return sizes
+
+def main():
+	parser = argparse.ArgumentParser(description = 'Time the labyrinth generator, path finding and navigation.')
+	parser.add_argument('--sizes', type = ParseSizes, default = defaultSizes, help = 'comma-separated LEVELSxROOMS sizes (default: 15x7,30x15,30x30,60x30)')
+	parser.add_argument('--seeds', type = lambda text: [int(seed) for seed in text.split(',')], default = defaultSeeds, help = 'comma-separated seeds (default: 1,2,3)')
+	parser.add_argument('--repeats', type = int, default = 5, help = 'the number of timed runs per size and seed')
+	parser.add_argument('--benchmarks', default = None, help = 'comma-separated names of the benchmarks to run (default: all)')
+	parser.add_argument('--output', default = None, help = 'the JSON file to write (default: standard output)')
+	parser.add_argument('--compare', default = None, help = 'a JSON file written by a previous run, to compare against')
+	args = parser.parse_args()
+
+	names = None
+
+	if args.benchmarks != None:
+		names = args.benchmarks.split(',')
+
+	results = RunBenchmarks(args.sizes, args.seeds, args.repeats, names)
+
+	if args.output != None:
+
+		with open(args.output, 'w') as outputFile:
+			json.dump(results, outputFile, indent = 1)
+	else:
+		print(json.dumps(results, indent = 1))
+
+	if args.compare != None:
+
+		with open(args.compare) as baselineFile:
+			baseline = json.load(baselineFile)
+
+		for line in CompareResults(baseline, results):
+			sys.stderr.write(line + '\n')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,116 @@
+# DisjointSet.py
+
+# A disjoint-set ("union-find") structure with path compression and union by rank.
+# The generator uses it to keep track of the "blobs" (sets of connected rooms); the label of a blob is the node at the root of its tree.
+
+# The items are the integers 0 to numberOfItems - 1, and each item is mapped to a node.  Detach() moves a group of items into a new set of
+# their own by giving them fresh nodes; the old nodes stay behind in the old set as "ghosts", so the items that remain in the old set
+# (and whose paths to the root may pass through those nodes) are not affected.  This is how a blob is split in two when a connection is removed.
+# When the ghosts come to outnumber the items, the structure is compacted.
+
+# The number of sets, and the size of each set, are kept up to date as sets are joined and split, so they never need to be counted.
+# New nodes (i.e. new labels) are simply appended, in O(1) amortized time; the ghosts are reclaimed all at once by Compact().
+
+from array import array
+
+class DisjointSet:
+	def __init__(self, numberOfItems):
+		self.nodes = array('i', range(numberOfItems))		# Maps each item to its current node.
+		self.parents = array('i', range(numberOfItems))		# Maps each node to its parent node; a root is its own parent.
+		self.ranks = array('B', bytes(numberOfItems))
+		self.sizes = array('i', [1]) * numberOfItems		# Maps each root to the number of items in its set.
+		self.numberOfSets = numberOfItems
+
+	def NewNode(self):
+		node = len(self.parents)
+		self.parents.append(node)
+		self.ranks.append(0)
+		self.sizes.append(0)
+		return node
+
+	def FindRoot(self, node):
+		parents = self.parents
+
+		while parents[node] != node:
+			parents[node] = parents[parents[node]]	# Path compression (by halving).
+			node = parents[node]
+
+		return node
+
+	def Find(self, item):
+		return self.FindRoot(self.nodes[item])
+
+	def Size(self, item):
+		# Return the number of items in the set that contains the given item.
+		return self.sizes[self.Find(item)]
+
+	def Union(self, item1, item2):
+		root1 = self.Find(item1)
+		root2 = self.Find(item2)
+
+		if root1 == root2:
+			return False	# The items were already in the same set.
+
+		if self.ranks[root1] < self.ranks[root2]:
+			root1, root2 = root2, root1
+
+		self.parents[root2] = root1
+		self.sizes[root1] += self.sizes[root2]
+		self.numberOfSets -= 1
+
+		if self.ranks[root1] == self.ranks[root2]:
+			self.ranks[root1] += 1
+
+		return True
+
+	def Detach(self, items):
+		# All of the items must currently be in the same set.  They are moved into a new set, whose root is returned.
+		# If they were the whole of the old set, the number of sets does not change.
+		oldRoot = self.Find(items[0])
+		self.sizes[oldRoot] -= len(items)
+
+		if self.sizes[oldRoot] > 0:
+			self.numberOfSets += 1
+
+		root = None
+
+		for item in items:
+			node = self.NewNode()
+
+			if root == None:
+				root = node
+			else:
+				self.parents[node] = root
+				self.ranks[root] = 1
+
+			self.nodes[item] = node
+
+		self.sizes[root] = len(items)
+
+		if len(self.parents) > 2 * len(self.nodes):
+			self.Compact()
+			root = self.Find(items[0])
+
+		return root
+
+	def Compact(self):
+		# Rebuild the structure so that each item is once again its own node, and discard the ghosts.
+		numberOfItems = len(self.nodes)
+		parents = array('i', range(numberOfItems))
+		ranks = array('B', bytes(numberOfItems))
+		sizes = array('i', [0]) * numberOfItems
+		representatives = {}	# Maps each old root to the first item found in its set.
+
+		for item in range(0, numberOfItems):
+			representative = representatives.setdefault(self.Find(item), item)
+
+			if representative != item:
+				parents[item] = representative
+				ranks[representative] = 1
+
+			sizes[representative] += 1
+
+		self.nodes = array('i', range(numberOfItems))
+		self.parents = parents
+		self.ranks = ranks
+		self.sizes = sizes
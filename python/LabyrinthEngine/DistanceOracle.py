@@ -0,0 +1,138 @@
+# DistanceOracle.py
+
+# Answers distance and shortest-path queries between any two rooms of a labyrinth.
+
+# When the connections form a tree (which they do unless extra connections have been added), the oracle roots the tree at room 0 and
+# records each room's parent, depth and "jump" pointer.  The jump pointers form a skew-binary ladder (Myers, 1983): each one skips
+# a number of levels that is one less than a power of two, so an ancestor at any given depth, and the lowest common ancestor
+# of two rooms, can be found in O(log n) steps, using O(n) memory.
+# When the connections do not form a tree, each query falls back to a breadth-first search.
+
+# The oracle records the version of the AdjacencyStore from which it was built; IsUpToDate() tells whether the connections have changed since.
+# The parents, depths and jump pointers of a tree may also be passed in (e.g. as memoryviews of a labyrinth file), in which case they are used as they are.
+
+from array import array
+from . import PathFinding
+
+class DistanceOracle:
+	def __init__(self, connections, root = 0, treeArrays = None):
+		numberOfRooms = connections.numberOfRooms
+
+		self.connections = connections
+		self.version = connections.version
+		self.root = root
+
+		if treeArrays != None:
+			self.parents, self.depths, self.jumps = treeArrays
+			self.isTree = True
+		else:
+			self.parents = array('i', [-1]) * numberOfRooms
+			self.depths = array('i', [0]) * numberOfRooms
+			self.jumps = array('i', [0]) * numberOfRooms
+			self.isTree = self.BuildTree()
+
+	def BuildTree(self):
+		# Return False if the connections do not form a tree.
+		parents = self.parents
+		depths = self.depths
+		jumps = self.jumps
+		root = self.root
+		parents[root] = root
+		jumps[root] = root
+		openList = [root]	# The rooms in breadth-first order; each parent is processed before its children.
+		numberOfRoomsReached = 1
+
+		for room in openList:
+			parent = parents[room]
+
+			for room2 in self.connections.Neighbours(room):
+
+				if room2 == parent:
+					continue
+				elif parents[room2] >= 0:
+					return False	# There is a cycle.
+
+				parents[room2] = room
+				depths[room2] = depths[room] + 1
+				jump = jumps[room]
+
+				if depths[room] - depths[jump] == depths[jump] - depths[jumps[jump]]:
+					jumps[room2] = jumps[jump]
+				else:
+					jumps[room2] = room
+
+				openList.append(room2)
+				numberOfRoomsReached += 1
+
+		return numberOfRoomsReached == len(parents)
+
+	def IsUpToDate(self):
+		return self.version == self.connections.version
+
+	def FindAncestorAtDepth(self, room, depth):
+		depths = self.depths
+
+		while depths[room] > depth:
+			jump = self.jumps[room]
+
+			if depths[jump] >= depth:
+				room = jump
+			else:
+				room = self.parents[room]
+
+		return room
+
+	def FindLowestCommonAncestor(self, room1, room2):
+		depth1 = self.depths[room1]
+		depth2 = self.depths[room2]
+
+		if depth1 > depth2:
+			room1 = self.FindAncestorAtDepth(room1, depth2)
+		elif depth2 > depth1:
+			room2 = self.FindAncestorAtDepth(room2, depth1)
+
+		# Rooms at the same depth have jump pointers to rooms at the same depth.
+		while room1 != room2:
+			jump1 = self.jumps[room1]
+			jump2 = self.jumps[room2]
+
+			if jump1 != jump2:
+				room1 = jump1
+				room2 = jump2
+			else:
+				room1 = self.parents[room1]
+				room2 = self.parents[room2]
+
+		return room1
+
+	def Distance(self, room1, room2):
+		# Return None if room2 cannot be reached from room1.
+
+		if not self.isTree:
+			return PathFinding.FindDistance(self.connections, room1, room2)
+
+		ancestor = self.FindLowestCommonAncestor(room1, room2)
+
+		return self.depths[room1] + self.depths[room2] - 2 * self.depths[ancestor]
+
+	def Path(self, room1, room2):
+
+		if not self.isTree:
+			return PathFinding.FindShortestPath(self.connections, room1, room2)
+
+		ancestor = self.FindLowestCommonAncestor(room1, room2)
+		path = []
+		pathFromRoom2 = []
+
+		while room1 != ancestor:
+			path.append(room1)
+			room1 = self.parents[room1]
+
+		while room2 != ancestor:
+			pathFromRoom2.append(room2)
+			room2 = self.parents[room2]
+
+		path.append(ancestor)
+		pathFromRoom2.reverse()
+		path.extend(pathFromRoom2)
+		return path
@@ -0,0 +1,109 @@
+# GenerationStats.py
+
+# Opt-in instrumentation for LabyrinthGenerator: counters for the hot paths, and the time spent in each phase of generation.
+# Pass a GenerationStats to the generator to use it:
+#   stats = GenerationStats()
+#   LabyrinthGenerator(15, 7, stats = stats).Generate()
+#   print(stats.ToDictionary())
+
+# The counters are kept by wrapping the generator's methods on the instance itself (see Attach()), so a generator that is not given
+# a GenerationStats runs exactly the same code as before; the only cost is a few "if stats != None" tests per call of Generate().
+
+# The phases are "seeding", "joining", "refactoring", "distanceOracle", "extraConnections", "reporting", "validityCheck", "longestPath"
+# and "bookPlacement".
+# The time of a phase excludes the time of any phase nested in it (e.g. "joining" excludes "refactoring").
+# The counters are:
+#   refactorAttempts, conflictTests, conflictRejections (the tests that found a conflict), failedPicks (the rooms removed from the open list
+#   because none of their possible neighbours could be joined), detachments, roomsRelabelled (in the parts detached), connectionsMade, connectionsRemoved.
+
+# Percentile() summarizes a list of timings; it is shared by Benchmarks and NavigationServer.
+
+import math
+import time
+
+def Percentile(sortedValues, percentage):
+	# The nearest-rank percentile.
+	return sortedValues[max(0, int(math.ceil(percentage / 100.0 * len(sortedValues))) - 1)]
+
+class GenerationStats:
+	def __init__(self):
+		self.counters = {}
+		self.phaseTimes = {}	# In seconds.
+		self.phase = None
+		self.phaseStartTime = 0.0
+
+	def Count(self, name, amount = 1):
+		self.counters[name] = self.counters.get(name, 0) + amount
+
+	def EnterPhase(self, name):
+		# Charge the time since the last change of phase to the current phase (if any), and make the given phase (which may be None)
+		# the current one.  Return the phase that was current, so that it can be entered again when a nested phase ends.
+		now = time.perf_counter()
+		previousPhase = self.phase
+
+		if previousPhase != None:
+			self.phaseTimes[previousPhase] = self.phaseTimes.get(previousPhase, 0.0) + now - self.phaseStartTime
+
+		self.phase = name
+		self.phaseStartTime = now
+		return previousPhase
+
+	def TimePhase(self, name, function):
+		# Return a function that calls the given one within the given phase.
+
+		def timedFunction(*args):
+			previousPhase = self.EnterPhase(name)
+
+			try:
+				return function(*args)
+			finally:
+				self.EnterPhase(previousPhase)
+
+		return timedFunction
+
+	def CountCalls(self, name, function):
+
+		def countedFunction(*args):
+			self.Count(name)
+			return function(*args)
+
+		return countedFunction
+
+	def Attach(self, generator):
+		# Wrap the generator's methods (and those of its open list and connections) on the instances themselves.
+		stats = self
+		findConflictingConnections = generator.FindConflictingConnections
+		detachSmallerPart = generator.DetachSmallerPart
+
+		def CountConflictTest(room1, room2):
+			stats.Count('conflictTests')
+
+			if findConflictingConnections(room1, room2):
+				stats.Count('conflictRejections')
+				return True
+
+			return False
+
+		def CountDetachment(room1, room2):
+			root = detachSmallerPart(room1, room2)
+			stats.Count('detachments')
+			stats.Count('roomsRelabelled', generator.roomLabels.sizes[root])
+			return root
+
+		generator.FindConflictingConnections = CountConflictTest
+		generator.DetachSmallerPart = CountDetachment
+		generator.Refactor = self.TimePhase('refactoring', self.CountCalls('refactorAttempts', generator.Refactor))
+		generator.AddExtraConnections = self.TimePhase('extraConnections', generator.AddExtraConnections)
+		generator.Report = self.TimePhase('reporting', generator.Report)
+		generator.FinalValidityCheck = self.TimePhase('validityCheck', generator.FinalValidityCheck)
+		generator.PrintLongestPath = self.TimePhase('longestPath', generator.PrintLongestPath)
+		generator.PlaceBooksInRooms = self.TimePhase('bookPlacement', generator.PlaceBooksInRooms)
+		generator.openList.Remove = self.CountCalls('failedPicks', generator.openList.Remove)
+		generator.connections.Connect = self.CountCalls('connectionsMade', generator.connections.Connect)
+		generator.connections.Disconnect = self.CountCalls('connectionsRemoved', generator.connections.Disconnect)
+
+	def ToDictionary(self):
+		return {
+			'counters': dict(self.counters),
+			'phaseTimes': dict(self.phaseTimes)
+		}
@@ -0,0 +1,54 @@
+# IndexedSet.py
+
+# A set of the integers 0 to capacity - 1 that also supports random access by position, so that a random member can be picked in O(1).
+# The members are kept in an array, and each integer's position in that array is kept in a second array (-1 if it is not a member).
+# Removing a member moves the last member into its place ("swap-remove"), so adding, removing and testing for membership are all O(1);
+# the order of the members is therefore not preserved.
+
+from array import array
+
+class IndexedSet:
+	def __init__(self, capacity):
+		self.items = array('i')
+		self.positions = array('i', [-1]) * capacity
+
+	def __len__(self):
+		return len(self.items)
+
+	def __getitem__(self, index):
+		return self.items[index]
+
+	def __iter__(self):
+		return iter(self.items)
+
+	def __contains__(self, item):
+		return self.positions[item] >= 0
+
+	def Add(self, item):
+		# Return False if the item was already a member.
+
+		if self.positions[item] >= 0:
+			return False
+
+		self.positions[item] = len(self.items)
+		self.items.append(item)
+		return True
+
+	def Extend(self, items):
+
+		for item in items:
+			self.Add(item)
+
+	def Remove(self, item):
+		position = self.positions[item]
+
+		if position < 0:
+			raise KeyError(item)
+
+		lastItem = self.items.pop()
+
+		if lastItem != item:
+			self.items[position] = lastItem
+			self.positions[lastItem] = position
+
+		self.positions[item] = -1
@@ -0,0 +1,236 @@
+# JorgeSimulation.py
+
+# Simulates many wandering "Jorge" agents at once, for load testing and for tuning.  It needs NumPy, which the rest of the engine does not,
+# so it is not imported by the package's __init__.py.
+
+# Each agent behaves as Jorge does in a NavigationSession: it walks, one room per tick, along the shortest path to a goal chosen at random,
+# and chooses a new goal (any room but the one it is in) as soon as it arrives.  The labyrinth's connections must form a tree,
+# since the paths are read off the tree recorded by its DistanceOracle instead of being searched for:
+# a path from room a to room b climbs from a to the lowest common ancestor of a and b, then descends to b.
+# So the state of every agent is a few integers, each held in an array: its room, its goal, how many steps of the current path
+# it has taken ("cursor"), how many of them climb ("climbLength"), and how many there are in all ("pathLength").
+# Each tick moves every agent at once: the climbing agents to their parents, and the descending agents to the child of their room
+# whose subtree contains their goal.  That child is found with a routing table: the rooms are numbered in depth-first order, so the
+# subtree of a room is a range of numbers, and the children of all of the rooms, sorted by (parent, number), can be searched for all of
+# the descending agents at once.  The lowest common ancestors are found with the oracle's jump pointers.
+
+# ProximityBands() classifies the distance from each of any number of players to the nearest agent, as NavigationSession reports it
+# for Jorge: the same room, very near (1 or 2), near (3 or 4), or not mentioned.  The distances are found by a breadth-first search
+# from all of the agents at once, which stops after 4 rings.
+
+# Usage: python3 -m LabyrinthEngine.JorgeSimulation [--levels 1000] [--rooms 100] [--seed 42] [--engine python|numpy] [--agents 100000]
+#   [--ticks 100] [--players 100000]
+
+import argparse
+import sys
+import time
+import numpy
+from .Labyrinth import LabyrinthGenerator
+from .NumpyLabyrinth import NumpyLabyrinthGenerator
+from .Reporting import QuietReporter
+
+sameRoom = 0
+veryNear = 1
+near = 2
+notMentioned = 3
+proximityMessages = (
+	["* You and the Venerable Jorge are in the same room! *", "'Good evening, Venerable Jorge.'"],
+	["The Venerable Jorge is very near."],
+	["The Venerable Jorge is near."],
+	[]
+)
+
+def ExpandRanges(starts, counts):
+	# Return the positions in all of the ranges [starts[i], starts[i] + counts[i]), in order.
+	return numpy.arange(int(counts.sum())) + numpy.repeat(starts - (numpy.cumsum(counts) - counts), counts)
+
+class JorgeSimulation:
+	def __init__(self, labyrinth, numberOfAgents, seed = None):
+		oracle = labyrinth.GetDistanceOracle()
+
+		if not oracle.isTree:
+			raise Exception('JorgeSimulation.__init__(): The connections of the labyrinth do not form a tree.')
+
+		numberOfRooms = labyrinth.numberOfRooms
+		self.numberOfRooms = numberOfRooms
+		self.parents = numpy.frombuffer(oracle.parents, dtype = numpy.int32)
+		self.depths = numpy.frombuffer(oracle.depths, dtype = numpy.int32)
+		self.jumps = numpy.frombuffer(oracle.jumps, dtype = numpy.int32)
+		self.random = numpy.random.default_rng(seed)
+
+		# The children of each room, in compressed sparse row form.
+		children = numpy.flatnonzero(self.parents != numpy.arange(numberOfRooms))
+		self.children = children[numpy.argsort(self.parents[children], kind = 'stable')].astype(numpy.int32)
+		self.childOffsets = numpy.zeros(numberOfRooms + 1, dtype = numpy.int64)
+		numpy.cumsum(numpy.bincount(self.parents[children], minlength = numberOfRooms), out = self.childOffsets[1:])
+		self.BuildRoutingTable()
+
+		self.rooms = self.random.integers(0, numberOfRooms, numberOfAgents, dtype = numpy.int32)
+		self.goals = self.rooms.copy()
+		self.climbLengths = numpy.zeros(numberOfAgents, dtype = numpy.int32)
+		self.cursors = numpy.zeros(numberOfAgents, dtype = numpy.int32)
+		self.pathLengths = numpy.zeros(numberOfAgents, dtype = numpy.int32)
+		self.numberOfTicks = 0
+
+	def BuildRoutingTable(self):
+		# Number the rooms in depth-first order (each room before its subtree, the children of a room in the order of self.children),
+		# one level of the tree at a time.
+		parents = self.parents
+		children = self.children
+		order = numpy.argsort(self.depths, kind = 'stable')
+		levelStarts = numpy.searchsorted(self.depths[order], numpy.arange(int(self.depths.max()) + 2))
+		subtreeSizes = numpy.ones(self.numberOfRooms, dtype = numpy.int64)
+
+		for depth in range(len(levelStarts) - 2, 0, -1):
+			level = order[levelStarts[depth]:levelStarts[depth + 1]]
+			numpy.add.at(subtreeSizes, parents[level], subtreeSizes[level])
+
+		# The number of rooms in the subtrees of each child's elder siblings.
+		childSizes = subtreeSizes[children]
+		totals = numpy.cumsum(childSizes)
+		offsets = totals - childSizes
+		offsets -= numpy.repeat(numpy.concatenate(([0], totals))[self.childOffsets[:-1]], numpy.diff(self.childOffsets))
+		offsetsByRoom = numpy.zeros(self.numberOfRooms, dtype = numpy.int64)
+		offsetsByRoom[children] = offsets
+		self.preorderNumbers = numpy.zeros(self.numberOfRooms, dtype = numpy.int64)
+		preorderNumbers = self.preorderNumbers
+
+		for depth in range(1, len(levelStarts) - 1):
+			level = order[levelStarts[depth]:levelStarts[depth + 1]]
+			preorderNumbers[level] = preorderNumbers[parents[level]] + 1 + offsetsByRoom[level]
+
+		# Sorted, since the children of each room are in order of their numbers.
+		self.routingKeys = parents[children].astype(numpy.int64) * self.numberOfRooms + preorderNumbers[children]
+
+	def FindNextRoomsTowards(self, rooms, goals):
+		# For every i, the child of rooms[i] whose subtree contains goals[i] (which must be a descendant of rooms[i]).
+		keys = rooms.astype(numpy.int64) * self.numberOfRooms + self.preorderNumbers[goals]
+		return self.children[numpy.searchsorted(self.routingKeys, keys, side = 'right') - 1]
+
+	def FindAncestorsAtDepths(self, rooms, depths):
+		# For every i, the ancestor of rooms[i] at depth depths[i] (which must not be greater than the depth of rooms[i]).
+		parents = self.parents
+		roomDepths = self.depths
+		jumps = self.jumps
+		rooms = rooms.copy()
+		active = numpy.flatnonzero(roomDepths[rooms] > depths)
+
+		while len(active) > 0:
+			activeRooms = rooms[active]
+			jump = jumps[activeRooms]
+			rooms[active] = numpy.where(roomDepths[jump] >= depths[active], jump, parents[activeRooms])
+			active = active[roomDepths[rooms[active]] > depths[active]]
+
+		return rooms
+
+	def FindLowestCommonAncestors(self, rooms1, rooms2):
+		# As DistanceOracle.FindLowestCommonAncestor(), for every pair at once.
+		depths = numpy.minimum(self.depths[rooms1], self.depths[rooms2])
+		rooms1 = self.FindAncestorsAtDepths(rooms1, depths)
+		rooms2 = self.FindAncestorsAtDepths(rooms2, depths)
+		active = numpy.flatnonzero(rooms1 != rooms2)
+
+		# Rooms at the same depth have jump pointers to rooms at the same depth.
+		while len(active) > 0:
+			jump1 = self.jumps[rooms1[active]]
+			jump2 = self.jumps[rooms2[active]]
+			differentJumps = jump1 != jump2
+			rooms1[active] = numpy.where(differentJumps, jump1, self.parents[rooms1[active]])
+			rooms2[active] = numpy.where(differentJumps, jump2, self.parents[rooms2[active]])
+			active = active[rooms1[active] != rooms2[active]]
+
+		return rooms1
+
+	def FindDistances(self, rooms1, rooms2):
+		return self.depths[rooms1] + self.depths[rooms2] - 2 * self.depths[self.FindLowestCommonAncestors(rooms1, rooms2)]
+
+	def ChooseNewGoals(self, agents):
+		# Any room but the one that the agent is in, each with the same probability.
+		rooms = self.rooms[agents]
+		goals = self.random.integers(0, self.numberOfRooms - 1, len(agents), dtype = numpy.int32)
+		goals += goals >= rooms
+		turnDepths = self.depths[self.FindLowestCommonAncestors(rooms, goals)]
+		self.goals[agents] = goals
+		self.cursors[agents] = 0
+		self.climbLengths[agents] = self.depths[rooms] - turnDepths
+		self.pathLengths[agents] = self.depths[rooms] + self.depths[goals] - 2 * turnDepths
+
+	def Tick(self):
+		# Move every agent one room along its path, choosing a new path first for the agents that have reached their goals.
+		self.ChooseNewGoals(numpy.flatnonzero(self.cursors >= self.pathLengths))
+		rooms = self.rooms
+		climbing = self.cursors < self.climbLengths
+		climbingAgents = numpy.flatnonzero(climbing)
+		descendingAgents = numpy.flatnonzero(~climbing)
+		rooms[climbingAgents] = self.parents[rooms[climbingAgents]]
+		rooms[descendingAgents] = self.FindNextRoomsTowards(rooms[descendingAgents], self.goals[descendingAgents])
+		self.cursors += 1
+		self.numberOfTicks += 1
+
+	def Run(self, numberOfTicks):
+
+		for i in range(0, numberOfTicks):
+			self.Tick()
+
+	def FindDistancesToNearestAgent(self, maximumDistance = 4):
+		# Return the distance from every room to the nearest agent, or maximumDistance + 1 if that is further than maximumDistance.
+		distances = numpy.full(self.numberOfRooms, maximumDistance + 1, dtype = numpy.int32)
+		ring = numpy.unique(self.rooms)
+		distances[ring] = 0
+
+		for distance in range(1, maximumDistance + 1):
+			starts = self.childOffsets[ring]
+			childRooms = self.children[ExpandRanges(starts, self.childOffsets[ring + 1] - starts)]
+			nextRing = numpy.concatenate((self.parents[ring], childRooms))
+			nextRing = nextRing[distances[nextRing] > distance]
+
+			if len(nextRing) == 0:
+				break
+
+			distances[nextRing] = distance
+			ring = numpy.flatnonzero(distances == distance)	# Without duplicates.
+
+		return distances
+
+	def ProximityBands(self, playerRooms):
+		# Return the proximity band (sameRoom, veryNear, near or notMentioned) of every player, given the room that each one is in.
+		bandsByDistance = numpy.array([sameRoom, veryNear, veryNear, near, near, notMentioned], dtype = numpy.int8)
+		return bandsByDistance[self.FindDistancesToNearestAgent(4)[playerRooms]]
+
+def main():
+	parser = argparse.ArgumentParser(description = 'Time a simulation of many Jorges at once.')
+	parser.add_argument('--levels', type = int, default = 1000, help = 'the number of levels')
+	parser.add_argument('--rooms', type = int, default = 100, help = 'the number of rooms per level')
+	parser.add_argument('--seed', type = int, default = None, help = 'the seed for the labyrinth and the simulation (default: a random seed)')
+	parser.add_argument('--engine', choices = ['python', 'numpy'], default = 'numpy', help = 'the generator to use (default: numpy)')
+	parser.add_argument('--agents', type = int, default = 100000, help = 'the number of agents (default: 100000)')
+	parser.add_argument('--ticks', type = int, default = 100, help = 'the number of ticks to time (default: 100)')
+	parser.add_argument('--players', type = int, default = 100000, help = 'the number of players whose proximity bands are computed after each tick (default: 100000)')
+	args = parser.parse_args()
+
+	if args.engine == 'numpy':
+		labyrinth = NumpyLabyrinthGenerator(args.levels, args.rooms, QuietReporter(), args.seed)
+	else:
+		labyrinth = LabyrinthGenerator(args.levels, args.rooms, QuietReporter(), args.seed)
+
+	labyrinth.Generate()
+	simulation = JorgeSimulation(labyrinth, args.agents, args.seed)
+	playerRooms = simulation.random.integers(0, labyrinth.numberOfRooms, args.players)
+	tickTime = 0.0
+	proximityTime = 0.0
+	bandCounts = numpy.zeros(4, dtype = numpy.int64)
+
+	for i in range(0, args.ticks):
+		startTime = time.perf_counter()
+		simulation.Tick()
+		tickTime += time.perf_counter() - startTime
+		startTime = time.perf_counter()
+		bandCounts += numpy.bincount(simulation.ProximityBands(playerRooms), minlength = 4)
+		proximityTime += time.perf_counter() - startTime
+
+	sys.stderr.write(str(args.agents) + ' agents, ' + str(args.players) + ' players, ' + str(labyrinth.numberOfRooms) + ' rooms\n')
+	sys.stderr.write('Tick: ' + str(round(tickTime / args.ticks * 1000, 3)) + ' ms; proximity bands: ' + str(round(proximityTime / args.ticks * 1000, 3)) + ' ms\n')
+	sys.stderr.write('Bands over all ticks (same room, very near, near, not mentioned): ' + ', '.join(str(count) for count in bandCounts) + '\n')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,594 @@
+# Labyrinth.py
+# The labyrinthine abbey library in Python - October 3, 2013
+
+# Internally, a room is represented by an integer: levelNumber * numberOfRoomsPerLevel + roomNumber.
+# RoomInfo is only used to view a room as a (level, room) pair, e.g. for display.
+
+import random
+#import sys
+from array import array
+from . import PathFinding
+from . import Sampling
+from . import VersionSpecificUtilities
+from .AdjacencyStore import AdjacencyStore
+from .DisjointSet import DisjointSet
+from .DistanceOracle import DistanceOracle
+from .IndexedSet import IndexedSet
+from .NavigationSession import NavigationSession
+from .PossibleNeighbours import GetPossibleNeighbourTable
+from .Reporting import ConsoleReporter
+from .TreeAnalytics import TreeAnalytics
+
+def NewSeed():
+	# A seed for a labyrinth whose seed was not given, taken from the operating system's source of randomness.
+	return random.SystemRandom().randrange(2 ** 64)
+
+class RoomInfo:
+	__slots__ = ('levelNumber', 'roomNumber')
+
+	def __init__(self, level, room):
+		self.levelNumber = level
+		self.roomNumber = room
+		#self.bookList = [] # Don't include this list in the hash, in order to keep the object hashable.
+
+	@staticmethod
+	def FromIndex(generator, index):
+		level, room = divmod(index, generator.numberOfRoomsPerLevel)
+		return RoomInfo(level, room)
+
+	def GetIndex(self, generator):
+		return self.levelNumber * generator.numberOfRoomsPerLevel + self.roomNumber
+
+	def __eq__(x, y):
+		return type(x) == type(y) and x.levelNumber == y.levelNumber and x.roomNumber == y.roomNumber
+
+	def __hash__(self):
+		return self.levelNumber * 1000003 + self.roomNumber
+
+	def ToString(self):
+		return "(" + str(self.levelNumber) + ", " + str(self.roomNumber) + ")"
+
+	def GeneratePossibleNeighbours(self, generator):
+		return list(RoomInfo.FromIndex(generator, room) for room in generator.GeneratePossibleNeighbours(self.GetIndex(generator)))
+
+class LabyrinthBase:
+	# The parts of a labyrinth that are needed to navigate it: its dimensions, its connections (any object with the read-only methods
+	# of an AdjacencyStore), roomGoal and booksInRooms.  LabyrinthGenerator creates a labyrinth; LabyrinthFile.MappedLabyrinth loads one.
+	# PrintLongestPath() and PlaceBooksInRooms() finish a newly generated labyrinth; they report through the given reporter (see Reporting).
+	# Each labyrinth has its own random number generator, so labyrinths in different threads do not disturb each other's sequences.
+	# If no seed is given, one is chosen at random; either way, it is recorded in self.seed, so that the labyrinth can be generated again.
+	goalBook = "The Second Book of the Poetics of Aristotle"
+	books = (	# The other books, which PlaceBooksInRooms() scatters at random.
+		"The First Book of the Poetics of Aristotle",
+		"The Iliad by Homer",
+		"The Odyssey by Homer",
+		"The Republic by Plato",
+		"Categories by Aristotle",
+		"Physics by Aristotle",
+		"Nicomachean Ethics by Aristotle",
+		"The Aeneid by Virgil",
+		"The Old Testament in Hebrew",
+		"The New Testament in Greek",
+		"Strong's Hebrew Dictionary",
+		"Strong's Greek Dictionary"
+	)
+
+	def __init__(self, numberOfLevels, numberOfRoomsPerLevel, reporter = None, seed = None):
+		self.numberOfLevels = numberOfLevels
+		self.numberOfRoomsPerLevel = numberOfRoomsPerLevel
+		self.numberOfRooms = numberOfLevels * numberOfRoomsPerLevel
+		self.rooms = range(0, self.numberOfRooms)
+		self.connections = None
+		self.distanceOracle = None
+		self.treeAnalytics = None
+		self.roomGoal = None
+		self.booksInRooms = {} # Maps rooms to book titles.
+
+		if seed == None:
+			seed = NewSeed()
+
+		self.seed = seed
+		self.random = random.Random(seed)
+
+		if reporter == None:
+			reporter = ConsoleReporter()
+
+		self.reporter = reporter
+
+	def RoomToString(self, room):
+		return RoomInfo.FromIndex(self, room).ToString()
+
+	def GetDistanceOracle(self):
+		# The oracle is rebuilt if the connections have changed since it was built.
+
+		if self.distanceOracle == None or not self.distanceOracle.IsUpToDate():
+			self.distanceOracle = DistanceOracle(self.connections)
+
+		return self.distanceOracle
+
+	def GetTreeAnalytics(self):
+		# Like the oracle, the analytics are rebuilt if the connections have changed since they were computed.
+		# The connections must form a tree.
+
+		if self.treeAnalytics == None or not self.treeAnalytics.IsUpToDate():
+			self.treeAnalytics = TreeAnalytics(self.GetDistanceOracle())
+
+		return self.treeAnalytics
+
+	def FindShortestPathBetweenRooms(self, room, roomGoalLocal):
+
+		if roomGoalLocal == None:
+			return PathFinding.FindShortestPath(self.connections, room, roomGoalLocal)
+
+		return self.GetDistanceOracle().Path(room, roomGoalLocal)
+
+	def FindLongestPathFromRoom(self, room):
+		return self.FindShortestPathBetweenRooms(room, None)
+
+	def FindDistanceBetweenRooms(self, room, roomGoalLocal, maximumDistance = None):
+		# Return None if roomGoalLocal is further away than maximumDistance.
+		# If the connections do not form a tree, the search stops at maximumDistance, rather than searching the whole labyrinth.
+		distanceOracle = self.GetDistanceOracle()
+
+		if not distanceOracle.isTree:
+			return PathFinding.FindDistance(self.connections, room, roomGoalLocal, maximumDistance)
+
+		distance = distanceOracle.Distance(room, roomGoalLocal)
+
+		if distance == None or (maximumDistance != None and distance > maximumDistance):
+			return None
+
+		return distance
+
+	def FindFarthestRoomFromRoom(self, room):
+		# Return a (farthestRoom, distance) tuple.
+
+		if self.GetDistanceOracle().isTree:
+			return self.GetTreeAnalytics().FindFarthestRoom(room)
+
+		return PathFinding.FindFarthestRoom(self.connections, room)
+
+	def NavigateLabyrinth(self):
+		# Play the game on the console.  The game itself is a NavigationSession, which uses this labyrinth's random number generator.
+		session = NavigationSession(self, self.random)
+
+		while True:
+
+			for line in session.Describe():
+				print(line)
+
+			#print "This is 'foo'."
+			# See https://stackoverflow.com/questions/1093322/how-do-i-check-what-version-of-python-is-running-my-script
+			# assert sys.version_info >= (2,5)
+			# print(sys.version_info)
+			# print(sys.version_info[0])
+			# print(sys.version_info.major)
+
+			# VersionSpecificUtilities.test()
+			
+			# if (sys.version_info.major == 3):
+				# print("Python 3")
+				# inputStr = input("Your move (or (h)elp or (q)uit): ") # Python 2's raw_input() is called "input()" in Python 3
+			# elif (sys.version_info.major == 2):
+				# print("Python 2")
+				# inputStr = raw_input("Your move (or (h)elp or (q)uit): ") # Python 2
+			# else:
+				# raise Exception('LabyrinthGenerator.NavigateLabyrinth(): Invalid version of Python: ' + str(sys.version_info))
+
+			inputStr = VersionSpecificUtilities.input(NavigationSession.prompt)
+
+			for line in session.Step(inputStr):
+				print(line)
+
+			if session.isFinished:
+				break
+
+	def PrintLongestPath(self):
+		# The longest path is the diameter of the tree (see TreeAnalytics); the goal is whichever end of it is farther from the room (0, 0).
+		# If extra connections have been added, the connections no longer form a tree, and the analytics of the tree as it was before
+		# they were added are used instead; the path reported is then the longest path in that spanning tree, which may no longer be
+		# a shortest path, so it is reported as such.
+		treeAnalytics = self.treeAnalytics
+
+		if treeAnalytics == None:
+			treeAnalytics = self.GetTreeAnalytics()
+
+		end1, end2 = treeAnalytics.diameterEnds
+		longestPathLength = treeAnalytics.diameter
+
+		if treeAnalytics.depths[end1] >= treeAnalytics.depths[end2]:
+			self.roomGoal = end1
+		else:
+			self.roomGoal = end2
+
+		#Console.WriteLine("The longest path contains {0} rooms:", longestPath.Count);
+		#Console.WriteLine(string.Join(" to ", longestPath));
+		if treeAnalytics.IsUpToDate():
+			self.reporter.Report('longestPath', "The longest path contains " + str(longestPathLength + 1) + " rooms.", numberOfRooms = longestPathLength + 1,
+				spanningTree = False)
+			pathFromOriginToGoalLength = treeAnalytics.depths[self.roomGoal]	# The tree is rooted at room 0, the room (0, 0).
+		else:
+			self.reporter.Report('longestPath', "The longest path in the spanning tree (before the extra connections were added) contains " +
+				str(longestPathLength + 1) + " rooms.", numberOfRooms = longestPathLength + 1, spanningTree = True)
+			pathFromOriginToGoalLength = self.FindDistanceBetweenRooms(0, self.roomGoal)
+
+		#Console.WriteLine("Aristotle's Second Book of the Poetics is in Room {0}.", roomGoal);
+		#Console.WriteLine();
+		#Console.WriteLine("The path from Room (0, 0) to Room {0} contains {1} rooms:", roomGoal, pathFromOriginToGoal.Count);
+		#Console.WriteLine(string.Join(" to ", pathFromOriginToGoal));
+		self.reporter.Report('pathToGoal', "The path from Room (0, 0) to the goal contains " + str(pathFromOriginToGoalLength + 1) + " rooms.",
+			numberOfRooms = pathFromOriginToGoalLength + 1)
+
+	def PlaceBooksInRooms(self):
+		roomsInRandomOrder = Sampling.RandomOrder(self.rooms, self.random)
+		booksInRandomOrder = Sampling.RandomOrder(self.books, self.random)
+		numBooksPlaced = 1
+
+		self.booksInRooms[self.roomGoal] = self.goalBook
+
+		while numBooksPlaced * 3 < len(self.rooms) and numBooksPlaced <= len(self.books):
+			room = next(roomsInRandomOrder)
+
+			if room == self.roomGoal:
+				continue
+
+			self.booksInRooms[room] = next(booksInRandomOrder)
+			numBooksPlaced += 1
+
+		#print "The books have been placed."
+
+class LabyrinthGenerator(LabyrinthBase):
+	# Progress is reported through the given reporter (see Reporting); by default, it is printed.
+	# NumpyLabyrinth.NumpyLabyrinthGenerator is a vectorized alternative, for labyrinths with millions of rooms.
+	# If a GenerationStats is given, generation is instrumented with counters and per-phase timers; otherwise, it is not instrumented at all.
+	# If numberOfExtraConnections is greater than zero, up to that many connections are added once the labyrinth is complete, to make loops
+	# (see AddExtraConnections()); numberOfExtraConnectionsAdded tells how many could be.
+
+	def __init__(self, numberOfLevels, numberOfRoomsPerLevel, reporter = None, seed = None, stats = None, numberOfExtraConnections = 0):
+
+		if numberOfLevels < 2 or numberOfRoomsPerLevel < 4: # or numberOfRoomsPerLevel > 100: # TODO: Delete the "> 100" condition when safe.
+			raise Exception('LabyrinthGenerator.__init__(): Invalid parameter(s).')
+
+		LabyrinthBase.__init__(self, numberOfLevels, numberOfRoomsPerLevel, reporter, seed)
+		self.numberOfExtraConnections = numberOfExtraConnections
+		self.numberOfExtraConnectionsAdded = 0
+		self.extraConnections = [] # A list of (room, room) tuples.
+		self.roomLabels = DisjointSet(self.numberOfRooms)	# The label of a room is the label of the "blob" to which it belongs.
+		self.connections = AdjacencyStore(numberOfLevels, numberOfRoomsPerLevel)
+		self.possibleNeighbours = GetPossibleNeighbourTable(numberOfLevels, numberOfRoomsPerLevel)
+		self.openList = IndexedSet(self.numberOfRooms)	# The rooms that may still have a possible neighbour in another blob.
+		self.frontier = array('i')	# Pairs of possible neighbours in different blobs that could not be connected because of a conflict, flattened.
+		self.numberOfDifferentLabels = 0
+		self.numberOfAttemptsToRefactor = 0
+		self.numberOfAttemptsToRefactorWithoutProgress = 0	# Since the number of blobs last fell below its lowest value at any refactoring.
+		self.maximumNumberOfAttemptsToRefactorWithoutProgress = 100
+		self.fewestDifferentLabelsWhenRefactoring = None
+		self.conflictCounts = [0, 0, 0]	# The number of conflicts of Types 1, 2 and 3 resolved while refactoring.
+		self.stats = stats
+
+		if stats != None:
+			stats.Attach(self)
+
+	def GeneratePossibleNeighbours(self, room):
+		# This returns a view into the shared table of possible neighbours (see PossibleNeighbours), which must not be modified.
+		return self.possibleNeighbours.Get(room)
+
+	# In the conflict tests below, room3 (and room4) may lie outside of the labyrinth (on level -1 or on level numberOfLevels);
+	# AdjacencyStore.AreConnected() simply returns False for such a room.
+
+	def FindConflictingConnections(self, room1, room2):
+		levelNumber1, roomNumber1 = divmod(room1, self.numberOfRoomsPerLevel)
+		levelNumber2, roomNumber2 = divmod(room2, self.numberOfRoomsPerLevel)
+
+		# Test 0: Room labels ("blob numbers").
+
+		#if (roomLabels[room1] == roomLabels[room2])
+		#    return true;    // There is a conflict.
+
+		# Test 1: Room 3 must not be connected to room 4.
+
+		# 4  2
+		#  \/
+		#  /\
+		# 1  3
+
+		room3 = levelNumber2 * self.numberOfRoomsPerLevel + roomNumber1
+		room4 = levelNumber1 * self.numberOfRoomsPerLevel + roomNumber2
+
+		if self.connections.AreConnected(room3, room4):
+			return True
+
+		# Test 2: Room 3 must not be connected to room 1.
+
+		# 3
+		#  \
+		#   1
+		#  /
+		# 2
+
+		room3 = (2 * levelNumber1 - levelNumber2) * self.numberOfRoomsPerLevel + roomNumber2
+
+		if self.connections.AreConnected(room1, room3):
+			return True
+
+		# Test 3: Room 3 must not be connected to room 2.
+
+		# 3
+		#  \
+		#   2
+		#  /
+		# 1
+
+		room3 = (2 * levelNumber2 - levelNumber1) * self.numberOfRoomsPerLevel + roomNumber1
+
+		if self.connections.AreConnected(room2, room3):
+			return True
+
+		return False   # There is no conflict.
+
+	def DetachSmallerPart(self, room1, room2):
+		# Called just after the connection between room1 and room2 has been removed.  Since a blob is a tree, this has split it in two.
+		# Flood-fill both parts at once, one room at a time, and stop as soon as either part has been filled: that part is the smaller one.
+		# Only the smaller part is given a new label and put back on the open list, so the cost is linear in the size of the smaller part,
+		# however large the blob (or the labyrinth) is.  The rooms in the smaller part will find any new pairs of possible neighbours
+		# that straddle the two parts, since the possible neighbours of a room are also its possible neighbours' possible neighbours.
+		stacks = ([room1], [room2])
+		roomsReached = (set([room1]), set([room2]))
+		parts = ([], [])
+		side = 0
+
+		while len(stacks[side]) > 0:
+			room = stacks[side].pop()
+			parts[side].append(room)
+
+			for otherRoom in self.connections.Neighbours(room):
+
+				if not otherRoom in roomsReached[side]:
+					roomsReached[side].add(otherRoom)
+					stacks[side].append(otherRoom)
+
+			side = 1 - side
+
+		self.openList.Extend(parts[side])
+		return self.roomLabels.Detach(parts[side])
+
+	def FindPossibleNeighboursWithDifferentLabels(self): #(out int room1, out int room2)
+
+		for room1 in Sampling.RandomOrder(self.rooms, self.random):
+
+			for room2 in Sampling.RandomOrder(self.GeneratePossibleNeighbours(room1), self.random):
+
+				if self.CanRefactorPair(room1, room2):
+					return (room1, room2)
+
+		raise Exception("Unable to find possible neighbours with different labels.")
+
+	def CanRefactorPair(self, room1, room2):
+		# Whether Refactor() may join room1 and room2 (which are possible neighbours), removing any connections that conflict.
+		return self.roomLabels.Find(room1) != self.roomLabels.Find(room2)
+
+	def TakePairFromFrontier(self): #(out int room1, out int room2)
+		# Remove a random pair from the frontier, discarding any pairs whose rooms have since been joined into the same blob.
+		# When the open list is empty, every pair of possible neighbours in different blobs is in the frontier: each room left the open list
+		# only after trying all of its possible neighbours, and any room in a part that has been split off since then is back on the open list.
+		frontier = self.frontier
+
+		while len(frontier) > 0:
+			index = 2 * self.random.randint(0, len(frontier) // 2 - 1)
+			room1 = frontier[index]
+			room2 = frontier[index + 1]
+			frontier[index] = frontier[-2]
+			frontier[index + 1] = frontier[-1]
+			del frontier[-2:]
+
+			if self.CanRefactorPair(room1, room2):
+				return (room1, room2)
+
+		return self.FindPossibleNeighboursWithDifferentLabels()	# This should not happen.
+
+	def Refactor(self):
+		# The print statement is replaced by the print() function in Python 3
+		#print "Refactoring..." # This worked in Python 2
+		self.reporter.Report('refactoring', "Refactoring...", attempt = self.numberOfAttemptsToRefactor)
+
+		room1, room2 = self.TakePairFromFrontier()
+		levelNumber1, roomNumber1 = divmod(room1, self.numberOfRoomsPerLevel)
+		levelNumber2, roomNumber2 = divmod(room2, self.numberOfRoomsPerLevel)
+
+		# Resolve the conflicts that are preventing a connection between room1 and room2.
+
+		# Test 1: Room 3 must not be connected to room 4.
+
+		# 4  2
+		#  \/
+		#  /\
+		# 1  3
+
+		room3 = levelNumber2 * self.numberOfRoomsPerLevel + roomNumber1
+		room4 = levelNumber1 * self.numberOfRoomsPerLevel + roomNumber2
+
+		if self.connections.AreConnected(room3, room4):
+			self.ReportConflict(1)
+			self.connections.Disconnect(room3, room4)
+			self.DetachSmallerPart(room3, room4)
+
+		# Test 2: Room 3 must not be connected to room 1.
+
+		# 3
+		#  \
+		#   1
+		#  /
+		# 2
+
+		room3 = (2 * levelNumber1 - levelNumber2) * self.numberOfRoomsPerLevel + roomNumber2
+
+		if self.connections.AreConnected(room1, room3):
+			self.ReportConflict(2)
+			self.connections.Disconnect(room1, room3)
+			self.DetachSmallerPart(room1, room3)
+
+		# Test 3: Room 3 must not be connected to room 2.
+
+		# 3
+		#  \
+		#   2
+		#  /
+		# 1
+
+		room3 = (2 * levelNumber2 - levelNumber1) * self.numberOfRoomsPerLevel + roomNumber1
+
+		if self.connections.AreConnected(room2, room3):
+			self.ReportConflict(3)
+			self.connections.Disconnect(room2, room3)
+			self.DetachSmallerPart(room2, room3)
+
+		# Connect room1 and room2.
+		self.roomLabels.Union(room1, room2)
+		self.connections.Connect(room1, room2)
+
+		self.numberOfDifferentLabels = self.roomLabels.numberOfSets
+
+	def ReportConflict(self, conflictType):
+		self.conflictCounts[conflictType - 1] += 1
+		self.reporter.Report('conflict', "Found a Type " + str(conflictType) + " conflict.", conflictType = conflictType)
+
+	def FinalValidityCheck(self):
+		# Rebuild the blobs from the connections alone, independently of the labels that were used during generation.
+		blobs = DisjointSet(self.numberOfRooms)
+
+		for room, otherRoom in self.connections.Edges():
+			blobs.Union(room, otherRoom)
+
+		if blobs.numberOfSets > 1:
+			raise Exception("The labyrinth is in multiple blobs.")
+
+		self.reporter.Report('singleBlob', "The labyrinth is a single blob.")
+
+	def AddExtraConnections(self):
+		# The candidates are the slots of the table of possible neighbours (each pair of possible neighbours once; see PossibleNeighbours),
+		# drawn in a random order.  A slot is taken if its rooms are not yet connected and the connection would not conflict with any other;
+		# both tests are O(1).  Adding a connection can only create conflicts, never remove them, so a slot that has been turned down
+		# never needs to be tested again, and the whole process costs O(1) per slot drawn.
+
+		for slot in Sampling.RandomOrder(range(0, self.possibleNeighbours.numberOfSlots), self.random):
+
+			if self.numberOfExtraConnectionsAdded >= self.numberOfExtraConnections:
+				break
+
+			room1, room2 = self.possibleNeighbours.GetSlot(slot)
+
+			if self.connections.AreConnected(room1, room2) or self.FindConflictingConnections(room1, room2):
+				continue
+
+			self.connections.Connect(room1, room2)
+			self.extraConnections.append((room1, room2))
+			self.numberOfExtraConnectionsAdded += 1
+
+	def Generate(self):
+		stats = self.stats
+
+		if stats != None:
+			stats.EnterPhase('seeding')
+
+		self.numberOfDifferentLabels = self.roomLabels.numberOfSets
+		self.openList.Extend(self.rooms)
+
+		if stats != None:
+			stats.EnterPhase('joining')
+
+		self.JoinBlobs()
+
+		if stats != None:
+			stats.EnterPhase('distanceOracle')
+
+		self.distanceOracle = DistanceOracle(self.connections)
+
+		if stats != None:
+			stats.EnterPhase(None)
+
+		if self.numberOfExtraConnections > 0:
+			self.GetTreeAnalytics()		# While the connections still form a tree (see PrintLongestPath()).
+			self.AddExtraConnections()
+
+		self.Report()
+		self.PrintLongestPath()		# This sets roomGoal.
+		self.PlaceBooksInRooms()	# This uses roomGoal.
+		self.reporter.Report('summary', None, numberOfAttemptsToRefactor = self.numberOfAttemptsToRefactor, conflictCounts = list(self.conflictCounts))
+
+	def JoinBlobs(self):
+		# Join the blobs, starting from the rooms on the open list, until there is only one.
+		# The number of refactorings grows with the number of rooms, so it is not limited as such.  Generation only gives up after
+		# maximumNumberOfAttemptsToRefactorWithoutProgress refactorings in a row that have not brought the number of blobs
+		# below the lowest number seen at any earlier refactoring.
+
+		while self.numberOfDifferentLabels > 1:
+
+			if len(self.openList) == 0:
+
+				if self.fewestDifferentLabelsWhenRefactoring == None or self.numberOfDifferentLabels < self.fewestDifferentLabelsWhenRefactoring:
+					self.fewestDifferentLabelsWhenRefactoring = self.numberOfDifferentLabels
+					self.numberOfAttemptsToRefactorWithoutProgress = 0
+				elif self.numberOfAttemptsToRefactorWithoutProgress >= self.maximumNumberOfAttemptsToRefactorWithoutProgress:
+					raise Exception("Refactored " + str(self.numberOfAttemptsToRefactorWithoutProgress) + " times in a row without reducing the number of blobs below " +
+						str(self.fewestDifferentLabelsWhenRefactoring) + " (" + str(self.numberOfAttemptsToRefactor) + " refactorings in all).")
+
+				self.numberOfAttemptsToRefactor += 1
+				self.numberOfAttemptsToRefactorWithoutProgress += 1
+				self.Refactor()
+
+				if len(self.openList) == 0:
+					continue	# The pair had no conflicts left, so no rooms were put back on the open list.
+
+			room1 = self.openList[self.random.randint(0, len(self.openList) - 1)]
+			room2 = None
+
+			for possibleNeighbour in Sampling.RandomOrder(self.GeneratePossibleNeighbours(room1), self.random):
+				#print "room1:", self.RoomToString(room1), "room2: ", self.RoomToString(possibleNeighbour)
+
+				if self.roomLabels.Find(room1) != self.roomLabels.Find(possibleNeighbour):
+
+					if not self.FindConflictingConnections(room1, possibleNeighbour):
+						room2 = possibleNeighbour
+						break
+
+					self.frontier.append(room1)
+					self.frontier.append(possibleNeighbour)
+
+			if room2 == None:
+				self.openList.Remove(room1)
+				continue
+
+			# We have now chosen room1 and room2.
+			self.connections.Connect(room1, room2)
+
+			# Join the two "blobs" to which the two rooms belong.
+			self.roomLabels.Union(room1, room2)
+			self.numberOfDifferentLabels = self.roomLabels.numberOfSets
+
+	def Report(self):
+
+		# There are two connection events per connection, so they are skipped altogether unless the reporter wants them.
+		if self.reporter.IsEnabledFor('connection'):
+
+			for room in self.rooms:
+
+				for otherRoom in self.connections.Neighbours(room):
+					self.reporter.Report('connection', self.RoomToString(room) + " to " + self.RoomToString(otherRoom), room1 = room, room2 = otherRoom)
+
+		if self.numberOfExtraConnections > 0:
+
+			if self.reporter.IsEnabledFor('extraConnection'):
+
+				for room1, room2 in self.extraConnections:
+					self.reporter.Report('extraConnection', "Extra connection added: " + self.RoomToString(room1) + " to " + self.RoomToString(room2) + ".",
+						room1 = room1, room2 = room2)
+
+			self.reporter.Report('extraConnections', str(self.numberOfExtraConnections) + " extra connection(s) requested; " +
+				str(self.numberOfExtraConnectionsAdded) + " added.", numberOfExtraConnections = self.numberOfExtraConnections,
+				numberOfExtraConnectionsAdded = self.numberOfExtraConnectionsAdded)
+
+		if self.numberOfAttemptsToRefactor > 0:
+			self.reporter.Report('refactorCount', "The labyrinth was refactored " + str(self.numberOfAttemptsToRefactor) + " time(s).",
+				numberOfAttemptsToRefactor = self.numberOfAttemptsToRefactor)
+
+		self.FinalValidityCheck()
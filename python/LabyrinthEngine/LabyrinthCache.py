@@ -0,0 +1,220 @@
+# LabyrinthCache.py
+
+# A cache in front of labyrinth generation, for services that hand out the same labyrinths again and again.
+# Get(numberOfLevels, numberOfRoomsPerLevel, seed) returns the labyrinth that the cache's engine would generate with that seed,
+# generating it only if it is not already cached.  The engine is "python" (LabyrinthGenerator) or "numpy" (NumpyLabyrinthGenerator,
+# which needs NumPy); the two generate different labyrinths from the same seed, so the engine is part of the key, and of the file name.
+
+# Each labyrinth is cached frozen, as the contents of its labyrinth file (see LabyrinthFile): the connections, roomGoal, booksInRooms and,
+# since the connections form a tree, the DistanceOracle's parents, depths and jump pointers, so no search is needed to answer distance queries.
+# What Get() returns is a MappedLabyrinth over those bytes, and the same object is returned to every caller until it is evicted,
+# so it must not be modified or closed.  Its TreeAnalytics are computed as soon as it is loaded, so that its size is known.
+
+# The labyrinths in memory are evicted in least recently used order, so that their total size stays within maximumBytes.
+# The size of a labyrinth is the size of its file plus the size of the arrays that are built beside it: the TreeAnalytics
+# (about half the size of the file), and the DistanceOracle's arrays if they had to be copied out of the file (on a big-endian machine).
+# A labyrinth larger than maximumBytes is never kept in memory.
+# If a directory is given, every labyrinth that is generated is also saved there, and a labyrinth that is not in memory is loaded
+# from there (into memory) before it is generated again.  The files in the directory are never evicted.
+
+# Statistics() returns the numbers of hits (in memory), disk hits, misses (generations) and evictions, and the size of the memory tier.
+
+# Usage: python3 -m LabyrinthEngine.LabyrinthCache [--levels 15] [--rooms 7] [--engine python|numpy] [--seeds 100] [--requests 10000]
+#   [--max-bytes 1000000] [--directory cache] [--seed 42]
+
+import argparse
+import collections
+import os
+import random
+import sys
+import time
+from array import array
+from . import LabyrinthFile
+from .Labyrinth import LabyrinthGenerator
+from .Reporting import QuietReporter
+
+def GenerateLabyrinth(numberOfLevels, numberOfRoomsPerLevel, seed):
+	generator = LabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, QuietReporter(), seed)
+	generator.Generate()
+	return generator
+
+def GenerateNumpyLabyrinth(numberOfLevels, numberOfRoomsPerLevel, seed):
+	from .NumpyLabyrinth import NumpyLabyrinthGenerator	# Imported only when it is used, since NumPy is optional.
+	generator = NumpyLabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, QuietReporter(), seed)
+	generator.Generate()
+	return generator
+
+generators = {'python': GenerateLabyrinth, 'numpy': GenerateNumpyLabyrinth}
+
+def MeasureLabyrinth(labyrinth, data):
+	# Return the number of bytes held by a MappedLabyrinth over the given data: the data itself, and any arrays built beside it
+	# (views into the data are not counted again).
+	size = len(data)
+	arrays = []
+
+	if labyrinth.distanceOracle != None:
+		arrays.extend((labyrinth.distanceOracle.parents, labyrinth.distanceOracle.depths, labyrinth.distanceOracle.jumps))
+
+	if labyrinth.treeAnalytics != None:
+		arrays.extend((labyrinth.treeAnalytics.order, labyrinth.treeAnalytics.heights, labyrinth.treeAnalytics.eccentricities,
+			labyrinth.treeAnalytics.diameterPath))
+
+	for values in arrays:
+
+		if isinstance(values, array):
+			size += values.itemsize * len(values)
+
+	return size
+
+class LabyrinthCache:
+	def __init__(self, maximumBytes, directory = None, engine = 'python', generate = None):
+		# generate(numberOfLevels, numberOfRoomsPerLevel, seed) must return a generated labyrinth; by default, it is the engine's generator.
+		# The engine names the labyrinths in the keys and the files, so caches with different engines can share a directory.
+
+		if generate == None:
+
+			if not engine in generators:
+				raise Exception('LabyrinthCache.__init__(): Unknown engine: ' + str(engine))
+
+			generate = generators[engine]
+
+		self.maximumBytes = maximumBytes
+		self.directory = directory
+		self.engine = engine
+		self.generate = generate
+		self.labyrinths = collections.OrderedDict()	# Maps each key to its labyrinth, from the least to the most recently used.
+		self.sizes = {}		# Maps each key to the size of its labyrinth, in bytes.
+		self.numberOfBytes = 0
+		self.numberOfHits = 0
+		self.numberOfDiskHits = 0
+		self.numberOfMisses = 0
+		self.numberOfEvictions = 0
+
+		if directory != None and not os.path.isdir(directory):
+			os.makedirs(directory)
+
+	def GetPath(self, key):
+		engine, numberOfLevels, numberOfRoomsPerLevel, seed = key
+		return os.path.join(self.directory, 'labyrinth-' + engine + '-' + str(numberOfLevels) + 'x' + str(numberOfRoomsPerLevel) + '-' + str(seed) + '.lbyr')
+
+	def Get(self, numberOfLevels, numberOfRoomsPerLevel, seed):
+
+		if seed == None:
+			raise Exception('LabyrinthCache.Get(): A seed is required; a labyrinth with a random seed cannot be looked up again.')
+
+		key = (self.engine, numberOfLevels, numberOfRoomsPerLevel, seed)
+		labyrinth = self.labyrinths.get(key)
+
+		if labyrinth != None:
+			self.numberOfHits += 1
+			self.labyrinths.move_to_end(key)
+			return labyrinth
+
+		data = self.ReadFromDisk(key)
+
+		if data != None:
+			self.numberOfDiskHits += 1
+		else:
+			self.numberOfMisses += 1
+			data = LabyrinthFile.SerializeLabyrinth(self.generate(numberOfLevels, numberOfRoomsPerLevel, seed), seed)
+			self.WriteToDisk(key, data)
+
+		labyrinth = LabyrinthFile.MappedLabyrinth(data)
+		labyrinth.GetTreeAnalytics()
+		self.Add(key, labyrinth, MeasureLabyrinth(labyrinth, data))
+		return labyrinth
+
+	def Add(self, key, labyrinth, size):
+
+		if size > self.maximumBytes:
+			return
+
+		self.labyrinths[key] = labyrinth
+		self.sizes[key] = size
+		self.numberOfBytes += size
+
+		while self.numberOfBytes > self.maximumBytes:
+			evictedKey = self.labyrinths.popitem(last = False)[0]
+			self.numberOfBytes -= self.sizes.pop(evictedKey)
+			self.numberOfEvictions += 1
+
+	def ReadFromDisk(self, key):
+		# Return the contents of the key's labyrinth file, or None if there is no such file.
+
+		if self.directory == None:
+			return None
+
+		try:
+
+			with open(self.GetPath(key), 'rb') as inputFile:
+				return inputFile.read()
+		except FileNotFoundError:
+			return None
+
+	def WriteToDisk(self, key, data):
+
+		if self.directory == None:
+			return
+
+		# Written under another name, then renamed, so that a file that is only partly written is never read.
+		path = self.GetPath(key)
+		temporaryPath = path + '.' + str(os.getpid()) + '.tmp'
+
+		with open(temporaryPath, 'wb') as outputFile:
+			outputFile.write(data)
+
+		os.replace(temporaryPath, path)
+
+	def Clear(self):
+		# Empty the memory tier (the files on disk are kept).
+		self.labyrinths.clear()
+		self.sizes.clear()
+		self.numberOfBytes = 0
+
+	def Statistics(self):
+		numberOfRequests = self.numberOfHits + self.numberOfDiskHits + self.numberOfMisses
+		hitRate = 0.0
+
+		if numberOfRequests > 0:
+			hitRate = self.numberOfHits / numberOfRequests
+
+		return {
+			'requests': numberOfRequests,
+			'hits': self.numberOfHits,
+			'diskHits': self.numberOfDiskHits,
+			'misses': self.numberOfMisses,
+			'evictions': self.numberOfEvictions,
+			'hitRate': hitRate,
+			'labyrinthsInMemory': len(self.labyrinths),
+			'bytesInMemory': self.numberOfBytes
+		}
+
+def main():
+	parser = argparse.ArgumentParser(description = 'Time a labyrinth cache under requests in which a few seeds are much more popular than the rest.')
+	parser.add_argument('--levels', type = int, default = 15, help = 'the number of levels')
+	parser.add_argument('--rooms', type = int, default = 7, help = 'the number of rooms per level')
+	parser.add_argument('--engine', choices = sorted(generators), default = 'python', help = 'the generator to use (default: python)')
+	parser.add_argument('--seeds', type = int, default = 100, help = 'the number of different seeds requested (default: 100)')
+	parser.add_argument('--requests', type = int, default = 10000, help = 'the number of requests (default: 10000)')
+	parser.add_argument('--max-bytes', type = int, default = 1000000, help = 'the size of the memory tier, in bytes (default: 1000000)')
+	parser.add_argument('--directory', default = None, help = 'the directory of the disk tier (default: no disk tier)')
+	parser.add_argument('--seed', type = int, default = None, help = 'the seed for the choice of requests (default: a random seed)')
+	args = parser.parse_args()
+
+	# Seed number i is requested with a probability proportional to 1 / (i + 1) (Zipf's law).
+	requestRandom = random.Random(args.seed)
+	seeds = requestRandom.choices(range(0, args.seeds), [1.0 / (i + 1) for i in range(0, args.seeds)], k = args.requests)
+	cache = LabyrinthCache(args.max_bytes, args.directory, args.engine)
+	startTime = time.perf_counter()
+
+	for seed in seeds:
+		cache.Get(args.levels, args.rooms, seed)
+
+	elapsedTime = time.perf_counter() - startTime
+	statistics = cache.Statistics()
+	sys.stderr.write(', '.join(name + ': ' + str(value) for name, value in statistics.items()) + '\n')
+	sys.stderr.write(str(args.requests) + ' requests in ' + str(round(elapsedTime, 3)) + ' seconds (' +
+		str(round(elapsedTime / args.requests * 1000, 4)) + ' ms per request)\n')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,84 @@
+# LabyrinthExport.py
+
+# Streams a labyrinth out as a sequence of records, for other tools: as JSON Lines, CSV or Graphviz DOT.
+# The records are generated lazily, and each one is written as soon as it is generated, so exporting takes constant memory
+# (beyond the labyrinth itself), however large the labyrinth is.
+
+# The records are dictionaries, in this order:
+#   {'type': 'labyrinth', 'numberOfLevels': ..., 'numberOfRoomsPerLevel': ..., 'numberOfRooms': ..., 'seed': ...}
+#   {'type': 'goal', 'room': ...} (if the labyrinth has a goal)
+#   {'type': 'connection', 'room1': ..., 'room2': ...} for each connection, once, with room1 < room2
+#   {'type': 'book', 'room': ..., 'title': ...} for each book, in order of room
+# A room is identified by its number: levelNumber * numberOfRoomsPerLevel + roomNumber.
+
+import csv
+import json
+
+csvFieldNames = ['type', 'room1', 'room2', 'room', 'title', 'numberOfLevels', 'numberOfRoomsPerLevel', 'numberOfRooms', 'seed']
+
+def GenerateRecords(labyrinth, seed = None):
+	yield {
+		'type': 'labyrinth',
+		'numberOfLevels': labyrinth.numberOfLevels,
+		'numberOfRoomsPerLevel': labyrinth.numberOfRoomsPerLevel,
+		'numberOfRooms': labyrinth.numberOfRooms,
+		'seed': seed
+	}
+
+	if labyrinth.roomGoal != None:
+		yield {'type': 'goal', 'room': labyrinth.roomGoal}
+
+	for room1, room2 in labyrinth.connections.Edges():
+		yield {'type': 'connection', 'room1': room1, 'room2': room2}
+
+	for room, title in sorted(labyrinth.booksInRooms.items()):
+		yield {'type': 'book', 'room': room, 'title': title}
+
+def WriteJsonLines(labyrinth, outputFile, seed = None):
+
+	for record in GenerateRecords(labyrinth, seed):
+		outputFile.write(json.dumps(record) + '\n')
+
+def WriteCsv(labyrinth, outputFile, seed = None):
+	# One row per record; the columns that do not apply to a record are left empty.
+	# outputFile should be opened with newline = '' (see the csv module).
+	writer = csv.DictWriter(outputFile, csvFieldNames, restval = '')
+	writer.writeheader()
+
+	for record in GenerateRecords(labyrinth, seed):
+		writer.writerow(record)
+
+def QuoteDotString(text):
+	return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def WriteDot(labyrinth, outputFile, seed = None):
+	# An undirected graph; only the goal and the rooms with books are given labels of their own.
+
+	for record in GenerateRecords(labyrinth, seed):
+		recordType = record['type']
+
+		if recordType == 'labyrinth':
+			outputFile.write('// ' + str(record['numberOfLevels']) + ' levels, ' + str(record['numberOfRoomsPerLevel']) + ' rooms per level, seed ' + str(seed) + '\n')
+			outputFile.write('graph labyrinth {\n')
+		elif recordType == 'goal':
+			outputFile.write('\t' + str(record['room']) + ' [label=' + QuoteDotString(labyrinth.RoomToString(record['room']) + ' (goal)') + ', shape=doublecircle];\n')
+		elif recordType == 'connection':
+			outputFile.write('\t' + str(record['room1']) + ' -- ' + str(record['room2']) + ';\n')
+		elif recordType == 'book':
+			outputFile.write('\t' + str(record['room']) + ' [xlabel=' + QuoteDotString(record['title']) + '];\n')
+
+	outputFile.write('}\n')
+
+writers = {
+	'jsonl': WriteJsonLines,
+	'csv': WriteCsv,
+	'dot': WriteDot
+}
+
+def ExportLabyrinth(labyrinth, outputFile, format, seed = None):
+	# format is 'jsonl', 'csv' or 'dot'.
+
+	if not format in writers:
+		raise Exception('ExportLabyrinth(): Unknown format: ' + str(format))
+
+	writers[format](labyrinth, outputFile, seed)
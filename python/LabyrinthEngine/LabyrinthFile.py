@@ -0,0 +1,196 @@
+# LabyrinthFile.py
+
+# A compact binary file format for generated labyrinths, and a labyrinth that is navigated directly against a memory-mapped file.
+# LabyrinthToDictionary() gives the JSON form of a labyrinth.
+
+# All numbers are little-endian.  A file consists of:
+#   The header: the magic number b'LBYR', the format version, numberOfLevels, numberOfRoomsPerLevel, the flags, roomGoal
+#     (0xFFFFFFFF if there is none), the number of connections (each connection is counted once in each direction),
+#     the number of books, and the seed (an unsigned 64-bit number; meaningful only if the SEED flag is set).
+#   The connections, in compressed sparse row form: numberOfRooms + 1 offsets, followed by the connected rooms;
+#     the neighbours of room r are at positions offsets[r] to offsets[r + 1] - 1 (see AdjacencyStore.CompactAdjacency).
+#   If the TREE flag is set: the parents, depths and jump pointers of a DistanceOracle rooted at room 0 (numberOfRooms of each).
+#   The books: for each book, its room, the length of its title in bytes, and its title in UTF-8, padded to a multiple of four bytes.
+# Each array starts on a four-byte boundary, so it can be used in place as a memoryview.
+
+import mmap
+import struct
+import sys
+from array import array
+from .AdjacencyStore import CompactAdjacency
+from .DistanceOracle import DistanceOracle
+from .Labyrinth import LabyrinthBase
+
+magicNumber = b'LBYR'
+formatVersion = 1
+seedFlag = 1
+treeFlag = 2
+noRoom = 0xFFFFFFFF
+header = struct.Struct('<4sIIIIIIIQ')
+bookHeader = struct.Struct('<II')
+
+def ArrayToBytes(a):
+
+	if sys.byteorder == 'big':
+		a = array(a.typecode, a)
+		a.byteswap()
+
+	return a.tobytes()
+
+def PadToFourBytes(data):
+	return data + bytes(-len(data) % 4)
+
+def SerializeLabyrinth(labyrinth, seed = None):
+	# Return the contents of a labyrinth file, as bytes.
+	flags = 0
+	sections = []
+
+	if seed != None:
+		flags |= seedFlag
+	else:
+		seed = 0
+
+	if hasattr(labyrinth.connections, 'ToCompactArrays'):
+		offsets, targets = labyrinth.connections.ToCompactArrays()
+	else:
+		offsets = array('I', labyrinth.connections.offsets)
+		targets = array('I', labyrinth.connections.targets)
+
+	sections.append(ArrayToBytes(offsets))
+	sections.append(ArrayToBytes(targets))
+
+	oracle = labyrinth.GetDistanceOracle()
+
+	if oracle.isTree and oracle.root == 0:
+		flags |= treeFlag
+
+		for treeArray in (oracle.parents, oracle.depths, oracle.jumps):
+			sections.append(ArrayToBytes(array('i', treeArray)))
+
+	for room, book in sorted(labyrinth.booksInRooms.items()):
+		title = book.encode('utf-8')
+		sections.append(PadToFourBytes(bookHeader.pack(room, len(title)) + title))
+
+	if labyrinth.roomGoal != None:
+		roomGoal = labyrinth.roomGoal
+	else:
+		roomGoal = noRoom
+
+	sections.insert(0, header.pack(magicNumber, formatVersion, labyrinth.numberOfLevels, labyrinth.numberOfRoomsPerLevel,
+		flags, roomGoal, len(targets), len(labyrinth.booksInRooms), seed))
+
+	return b''.join(sections)
+
+def LabyrinthToDictionary(labyrinth, seed = None):
+	# Return a labyrinth in a form that can be written as JSON.  Each connection is listed once, as [room1, room2] with room1 < room2.
+	result = {
+		'seed': seed,
+		'numberOfLevels': labyrinth.numberOfLevels,
+		'numberOfRoomsPerLevel': labyrinth.numberOfRoomsPerLevel,
+		'connections': list(labyrinth.connections.Edges()),
+		'roomGoal': labyrinth.roomGoal,
+		'booksInRooms': sorted(labyrinth.booksInRooms.items())
+	}
+
+	if hasattr(labyrinth, 'numberOfAttemptsToRefactor'):
+		result['numberOfAttemptsToRefactor'] = labyrinth.numberOfAttemptsToRefactor
+		result['conflictCounts'] = labyrinth.conflictCounts
+
+	if getattr(labyrinth, 'numberOfExtraConnections', 0) > 0:
+		result['extraConnections'] = labyrinth.extraConnections
+
+	return result
+
+def SaveLabyrinth(labyrinth, path, seed = None):
+
+	with open(path, 'wb') as outputFile:
+		outputFile.write(SerializeLabyrinth(labyrinth, seed))
+
+def LoadLabyrinth(path):
+	# The file stays mapped until the labyrinth is closed.
+
+	with open(path, 'rb') as inputFile:
+		fileMap = mmap.mmap(inputFile.fileno(), 0, access = mmap.ACCESS_READ)
+
+	return MappedLabyrinth(fileMap)
+
+class MappedLabyrinth(LabyrinthBase):
+	# A labyrinth read from the contents of a labyrinth file: a memory map, or any other buffer (such as bytes).
+	# The connections and the DistanceOracle use the buffer in place; only the books are copied out of it.
+
+	def __init__(self, buffer):
+		self.buffer = buffer
+		self.views = []
+		view = memoryview(buffer)
+		self.views.append(view)
+
+		if len(view) < header.size:
+			raise Exception('MappedLabyrinth.__init__(): The labyrinth file is truncated.')
+
+		magic, version, numberOfLevels, numberOfRoomsPerLevel, flags, roomGoal, numberOfConnections, numberOfBooks, seed = header.unpack_from(view, 0)
+
+		if magic != magicNumber or version != formatVersion:
+			raise Exception('MappedLabyrinth.__init__(): This is not a labyrinth file, or its format version is not supported.')
+
+		# The labyrinth's random number generator (used by Jorge and by navigation) is seeded with the recorded seed, if there is one,
+		# so that it draws the same sequence every time that the file is loaded.
+		recordedSeed = None
+
+		if flags & seedFlag != 0:
+			recordedSeed = seed
+
+		LabyrinthBase.__init__(self, numberOfLevels, numberOfRoomsPerLevel, None, recordedSeed)
+
+		numberOfRooms = self.numberOfRooms
+		position = header.size
+		offsets, position = self.GetArray(view, position, 'I', numberOfRooms + 1)
+		targets, position = self.GetArray(view, position, 'I', numberOfConnections)
+		self.connections = CompactAdjacency(numberOfLevels, numberOfRoomsPerLevel, offsets, targets)
+
+		if flags & treeFlag != 0:
+			parents, position = self.GetArray(view, position, 'i', numberOfRooms)
+			depths, position = self.GetArray(view, position, 'i', numberOfRooms)
+			jumps, position = self.GetArray(view, position, 'i', numberOfRooms)
+			self.distanceOracle = DistanceOracle(self.connections, 0, (parents, depths, jumps))
+
+		for i in range(0, numberOfBooks):
+			room, length = bookHeader.unpack_from(view, position)
+			position += bookHeader.size
+			self.booksInRooms[room] = bytes(view[position:position + length]).decode('utf-8')
+			position += length + (-length % 4)
+
+		if roomGoal != noRoom:
+			self.roomGoal = roomGoal
+
+		self.seed = recordedSeed	# If no seed was recorded, the one that LabyrinthBase chose does not generate this labyrinth.
+
+	def GetArray(self, view, position, typecode, count):
+		# Return the array of count numbers at the given position, and the position that follows it.
+		endPosition = position + 4 * count
+
+		if endPosition > len(view):
+			raise Exception('MappedLabyrinth.GetArray(): The labyrinth file is truncated.')
+
+		if sys.byteorder == 'big':
+			result = array(typecode)
+			result.frombytes(view[position:endPosition])
+			result.byteswap()
+		else:
+			result = view[position:endPosition].cast(typecode)
+			self.views.append(result)
+
+		return (result, endPosition)
+
+	def Close(self):
+		# The views must be released before the memory map can be closed.
+		self.connections = None
+		self.distanceOracle = None
+		self.treeAnalytics = None
+
+		for view in reversed(self.views):
+			view.release()
+
+		self.views = []
+
+		if isinstance(self.buffer, mmap.mmap):
+			self.buffer.close()
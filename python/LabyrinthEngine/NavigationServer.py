@@ -0,0 +1,213 @@
+# NavigationServer.py
+
+# Serves the game over TCP, to any number of players at once, with asyncio.  Every player gets a NavigationSession of their own,
+# and all of the sessions share one labyrinth, which they only read.
+
+# The protocol is line-based (UTF-8, with lines ending in "\n").  On connecting, and after each command, the server sends the lines
+# that the console game would print, ending with the prompt line (NavigationSession.prompt); the client then sends one command per line.
+# After "q", the server closes the connection.  Anything that can talk lines over TCP (e.g. nc or telnet) can play.
+
+# PlayOverNetwork() is a client for testing: it plays a list of commands and returns everything that the server sent.
+# --players runs that many clients against a server in the same process, each playing --moves random moves, with a random pause
+# of up to twice --think-time seconds before each one, and writes the median and the 99th percentile of the time that the server spent
+# on each move, and of each move's round trip, to standard error.  The clients share the server's thread, so with no pauses,
+# the round trips measure how long the moves wait in line rather than how long they take.
+
+# Usage: python3 -m LabyrinthEngine.NavigationServer [--levels 15] [--rooms 7] [--seed 42] [--input labyrinth.lbyr] [--host 127.0.0.1] [--port 8023]
+#   [--players 1000 [--moves 50] [--think-time 1]]
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from . import LabyrinthFile
+from .GenerationStats import Percentile
+from .Labyrinth import LabyrinthGenerator
+from .NavigationSession import NavigationSession
+from .Reporting import QuietReporter
+
+class NavigationServer:
+	def __init__(self, labyrinth, seed = None):
+		self.labyrinth = labyrinth
+		self.random = random.Random(seed)	# Only used to seed the sessions' own random number generators.
+		self.server = None
+		self.numberOfSessions = 0
+		self.numberOfActiveSessions = 0
+		self.moveTimes = None	# If this is a list, the time (in seconds) that the server spends on each move is appended to it.
+		labyrinth.GetDistanceOracle()	# Built now, rather than by whichever session happens to need it first.
+
+	def EncodeResponse(self, session, lines):
+
+		if not session.isFinished:
+			lines.append(NavigationSession.prompt)
+		elif len(lines) == 0:
+			return b''
+
+		return ('\n'.join(lines) + '\n').encode('utf-8')
+
+	async def HandleClient(self, reader, writer):
+		session = NavigationSession(self.labyrinth, random.Random(self.random.getrandbits(64)))
+		self.numberOfSessions += 1
+		self.numberOfActiveSessions += 1
+
+		try:
+			writer.write(self.EncodeResponse(session, session.Describe()))
+
+			while not session.isFinished:
+				line = await reader.readline()
+
+				if line == b'':
+					break	# The player has gone.
+
+				startTime = time.perf_counter()
+				lines = session.Step(line.decode('utf-8', 'replace').strip())
+
+				if not session.isFinished:
+					lines.extend(session.Describe())
+
+				writer.write(self.EncodeResponse(session, lines))
+
+				if self.moveTimes != None:
+					self.moveTimes.append(time.perf_counter() - startTime)
+
+				await writer.drain()
+		except ConnectionError:
+			pass
+		finally:
+			self.numberOfActiveSessions -= 1
+			writer.close()
+
+	async def Start(self, host = '127.0.0.1', port = 0):
+		# Start listening, and return the port (which is chosen by the system if port is 0).
+		self.server = await asyncio.start_server(self.HandleClient, host, port, backlog = 4096)
+		return self.server.sockets[0].getsockname()[1]
+
+	async def Close(self):
+		self.server.close()
+		await self.server.wait_closed()
+
+async def ReadResponse(reader):
+	# Read the lines up to and including the prompt, or up to the end of the stream.
+	lines = []
+
+	while True:
+		line = await reader.readline()
+
+		if line == b'':
+			return lines
+
+		line = line.decode('utf-8').rstrip('\n')
+		lines.append(line)
+
+		if line == NavigationSession.prompt:
+			return lines
+
+async def PlayOverNetwork(host, port, commands, roundTripTimes = None, thinkTime = 0, thinkRandom = None):
+	# Send the commands one at a time, each after the server's prompt, and return all of the lines that the server sent.
+	# If roundTripTimes is a list, the time from sending each command to receiving the prompt is appended to it.
+	# If thinkTime is greater than zero, wait a random time of up to twice that many seconds before sending each command.
+	reader, writer = await asyncio.open_connection(host, port)
+	transcript = await ReadResponse(reader)
+
+	try:
+
+		for command in commands:
+
+			if len(transcript) == 0 or transcript[-1] != NavigationSession.prompt:
+				break	# The server has closed the connection.
+
+			if thinkTime > 0:
+				await asyncio.sleep(thinkRandom.uniform(0, 2 * thinkTime))
+
+			startTime = time.perf_counter()
+			writer.write((command + '\n').encode('utf-8'))
+			await writer.drain()
+			transcript.extend(await ReadResponse(reader))
+
+			if roundTripTimes != None and transcript[-1] == NavigationSession.prompt:
+				roundTripTimes.append(time.perf_counter() - startTime)
+	finally:
+		writer.close()
+
+	return transcript
+
+def CreateScript(scriptRandom, numberOfMoves):
+	# Random moves (some of which will be out of range), with a request for help every tenth move, followed by "q".
+	script = []
+
+	for i in range(0, numberOfMoves):
+
+		if i % 10 == 9:
+			script.append('h')
+		else:
+			script.append(str(scriptRandom.randint(0, 2)))
+
+	script.append('q')
+	return script
+
+async def SimulatePlayers(labyrinth, numberOfPlayers, numberOfMoves, thinkTime = 0, seed = None):
+	# Return the lists of server times and of round-trip times, one per move.
+	server = NavigationServer(labyrinth, seed)
+	server.moveTimes = []
+	port = await server.Start()
+	scriptRandom = random.Random(seed)
+	roundTripTimes = []
+
+	try:
+		await asyncio.gather(*(PlayOverNetwork('127.0.0.1', port, CreateScript(scriptRandom, numberOfMoves), roundTripTimes, thinkTime, scriptRandom)
+			for i in range(0, numberOfPlayers)))
+	finally:
+		await server.Close()
+
+	return (server.moveTimes, roundTripTimes)
+
+def DescribeTimes(name, times):
+	times = sorted(times)
+
+	if len(times) == 0:
+		return name + ': no moves'
+
+	return name + ': median ' + str(round(Percentile(times, 50) * 1000, 4)) + ' ms, p99 ' + str(round(Percentile(times, 99) * 1000, 4)) + ' ms'
+
+async def Serve(labyrinth, host, port, seed = None):
+	server = NavigationServer(labyrinth, seed)
+	port = await server.Start(host, port)
+	sys.stderr.write('Serving on ' + host + ':' + str(port) + '\n')
+
+	async with server.server:
+		await server.server.serve_forever()
+
+def main():
+	parser = argparse.ArgumentParser(description = 'Serve the labyrinth game over TCP, to many players at once.')
+	parser.add_argument('--levels', type = int, default = 15, help = 'the number of levels')
+	parser.add_argument('--rooms', type = int, default = 7, help = 'the number of rooms per level')
+	parser.add_argument('--seed', type = int, default = None, help = 'the seed for the labyrinth and the sessions (default: a random seed)')
+	parser.add_argument('--input', default = None, help = 'a labyrinth file to serve, instead of generating a labyrinth')
+	parser.add_argument('--host', default = '127.0.0.1', help = 'the address to listen on (default: 127.0.0.1)')
+	parser.add_argument('--port', type = int, default = 8023, help = 'the port to listen on (default: 8023)')
+	parser.add_argument('--players', type = int, default = 0, help = 'instead of serving, simulate this many players at once, and time their moves')
+	parser.add_argument('--moves', type = int, default = 50, help = 'the number of moves made by each simulated player (default: 50)')
+	parser.add_argument('--think-time', type = float, default = 1.0, help = 'the mean pause before each simulated move, in seconds (default: 1)')
+	args = parser.parse_args()
+
+	if args.input != None:
+		labyrinth = LabyrinthFile.LoadLabyrinth(args.input)
+	else:
+		labyrinth = LabyrinthGenerator(args.levels, args.rooms, QuietReporter(), args.seed)
+		labyrinth.Generate()
+
+	if args.players > 0:
+		moveTimes, roundTripTimes = asyncio.run(SimulatePlayers(labyrinth, args.players, args.moves, args.think_time, args.seed))
+		sys.stderr.write(str(args.players) + ' players, ' + str(len(moveTimes)) + ' moves\n')
+		sys.stderr.write(DescribeTimes('Server time per move', moveTimes) + '\n')
+		sys.stderr.write(DescribeTimes('Round trip per move', roundTripTimes) + '\n')
+	else:
+
+		try:
+			asyncio.run(Serve(labyrinth, args.host, args.port, args.seed))
+		except KeyboardInterrupt:
+			pass
+
+if __name__ == '__main__':
+	main()
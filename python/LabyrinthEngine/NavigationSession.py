@@ -0,0 +1,125 @@
+# NavigationSession.py
+
+# One player's game in a labyrinth, as an object that is advanced one command at a time, instead of a loop that reads the console.
+# Describe() returns the lines that describe the player's room (and marks it as visited); Step() carries out one command
+# ("h", "q", or the number of a move) and Jorge's move, and returns the lines that it produced.  Nothing is printed.
+# LabyrinthBase.NavigateLabyrinth() drives a session from the console; NavigationServer drives many sessions at once over the network.
+
+# A session never modifies the labyrinth, so any number of sessions can share one (the labyrinth's DistanceOracle is built
+# when it is first needed; build it before the sessions start if they run in several threads).
+# Each session has its own random number generator, for Jorge; by default, a new one with a random seed.
+
+import random
+
+class NavigationSession:
+	prompt = 'Your move (or (h)elp or (q)uit): '
+	JorgesNoticeDistance = 4	# Jorge is not mentioned if he is further away than this.
+
+	def __init__(self, labyrinth, randomNumberGenerator = None):
+
+		if randomNumberGenerator == None:
+			randomNumberGenerator = random.Random()
+
+		self.labyrinth = labyrinth
+		self.random = randomNumberGenerator
+		self.room = 0	# The room (0, 0).
+		self.roomsVisited = set()
+		self.neighbouringRooms = []
+		self.isFinished = False
+
+		#Console.WriteLine("Selecting a room for Jorge out of {0} rooms.", rooms.Count);
+
+		self.JorgesRoom = self.random.randint(0, labyrinth.numberOfRooms - 1)
+		self.JorgesPath = self.ConstructJorgesPath(self.JorgesRoom)
+		self.JorgesPathIndex = 0
+
+	def ConstructJorgesPath(self, JorgesRoom):
+		#int JorgesGoal;
+
+		# ThAW 2013/10/04 : There appears to be no do...while loop in Python.
+		while True:
+			JorgesGoal = self.random.randint(0, self.labyrinth.numberOfRooms - 1)
+
+			if JorgesGoal != JorgesRoom:
+				break
+
+		return self.labyrinth.FindShortestPathBetweenRooms(JorgesRoom, JorgesGoal)
+
+	def DescribeProximityToJorge(self, lines):
+		distance = self.labyrinth.FindDistanceBetweenRooms(self.room, self.JorgesRoom, self.JorgesNoticeDistance)
+
+		if distance == None:
+			return
+		elif distance == 0:
+			lines.append("* You and the Venerable Jorge are in the same room! *")
+			lines.append("'Good evening, Venerable Jorge.'")
+		elif distance <= 2:
+			lines.append("The Venerable Jorge is very near.")
+		else:
+			lines.append("The Venerable Jorge is near.")
+
+	def Describe(self):
+		labyrinth = self.labyrinth
+		room = self.room
+		self.roomsVisited.add(room)
+		lines = ["", "You are now in room " + labyrinth.RoomToString(room) + "."]
+		#Console.WriteLine("The Venerable Jorge is now in room {0}.", JorgesRoom);
+		#Console.WriteLine("Jorge's destination is room {0}", JorgesPath[JorgesPath.Count - 1]);
+
+		self.DescribeProximityToJorge(lines)
+
+		if room in labyrinth.booksInRooms:
+			lines.append("You have found the book '" + labyrinth.booksInRooms[room] + "'.")
+
+		if room == labyrinth.roomGoal:
+			lines.append("**** Congratulations!  You have reached the goal! ****")
+
+		self.neighbouringRooms = labyrinth.connections.Neighbours(room)
+		lines.append("Possible moves:")
+
+		for i in range(0, len(self.neighbouringRooms)):
+			neighbouringRoom = self.neighbouringRooms[i]
+			s = "  " + str(i) + ". " + labyrinth.RoomToString(neighbouringRoom)	# "s" is for "string".
+
+			if neighbouringRoom in self.roomsVisited:
+				s = s + " Visited"
+
+			lines.append(s)
+
+		return lines
+
+	def Step(self, inputStr):
+		# Carry out the given command, which should follow a call of Describe().  After "q", isFinished is True, and Jorge does not move.
+		labyrinth = self.labyrinth
+		lines = []
+
+		if (inputStr == ""):
+			lines.append("The input is empty.")
+		elif inputStr == "h":
+			pathToGoal = labyrinth.FindShortestPathBetweenRooms(self.room, labyrinth.roomGoal)
+			lines.append("Path to goal: " + " to ".join(labyrinth.RoomToString(roomInPath) for roomInPath in pathToGoal) + ".")
+		elif inputStr == "q":
+			self.isFinished = True
+			return lines
+		else:
+
+			try:
+				inputInt = int(inputStr)
+
+				if inputInt < 0 or inputInt >= len(self.neighbouringRooms):
+					lines.append("The input is out of range.")
+				else:
+					self.room = self.neighbouringRooms[inputInt]
+					self.DescribeProximityToJorge(lines)
+			except (NameError, SyntaxError, ValueError):
+				lines.append("The input was not recognized.")
+
+		# Jorge's move.
+		self.JorgesPathIndex += 1
+
+		while self.JorgesPathIndex >= len(self.JorgesPath): # ThAW 2013/09/23 : This "while" used to be an "if", but it crashed once.
+			self.JorgesPath = self.ConstructJorgesPath(self.JorgesRoom)
+			self.JorgesPathIndex = 1
+
+		self.JorgesRoom = self.JorgesPath[self.JorgesPathIndex]
+		return lines
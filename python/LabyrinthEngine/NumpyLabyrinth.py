@@ -0,0 +1,335 @@
+# NumpyLabyrinth.py
+
+# A vectorized labyrinth generator, for labyrinths with millions of rooms.  It needs NumPy, which the rest of the engine does not,
+# so it is not imported by the package's __init__.py.
+
+# The possible connections ("slots") between level g and level g + 1 are numbered 0 to 4 * (numberOfRoomsPerLevel - 1) - 1.
+# With H = numberOfRoomsPerLevel - 1 (the number of the hub room), slot k of a gap connects:
+#   k in [0, H):       room k on the lower level to room (k + 1) % H on the upper level;
+#   k in [H, 2H):      room a = k - H on the lower level to room (a - 1) % H on the upper level;
+#   k in [2H, 3H):     room a = k - 2H on the lower level to the hub on the upper level;
+#   k in [3H, 4H):     the hub on the lower level to room b = k - 3H on the upper level.
+# These are exactly the connections allowed by LabyrinthGenerator.GeneratePossibleNeighbours().
+
+# Every slot has a "partner" that connects the same two room numbers the other way round (lower room b to upper room a).
+# The three conflict tests of LabyrinthGenerator.FindConflictingConnections() all say the same thing in these terms:
+# a connection in slot k of gap g conflicts with a connection in the partner slot of gap g - 1, g or g + 1.
+# So the conflicts of every slot can be tested at once, with a few shifted array lookups.
+
+# Generation is a randomized Borůvka/Kruskal process.  In each round, every blob picks, among the connections that would join it
+# to another blob without a conflict, the one with the lowest random priority; this set of connections cannot contain a cycle.
+# Those of them that would conflict with each other are thinned out (only the lowest priority in each neighbourhood is kept), and the rest are made.
+# The blobs are labelled with a union-find forest that is joined by hooking roots and compressed by pointer jumping.
+# If the blobs can no longer be joined without a conflict, the generator refactors, as LabyrinthGenerator does: it removes the
+# connections that block some of the joins, makes those joins, and carries on.
+
+from array import array
+import numpy
+from .AdjacencyStore import CompactAdjacency
+from .DistanceOracle import DistanceOracle
+from .Labyrinth import LabyrinthBase
+from .TreeAnalytics import TreeAnalytics
+
+def CompressLabels(parents):
+	# Point every node of a union-find forest directly at its root (pointer jumping).
+
+	while True:
+		grandparents = parents[parents]
+
+		if numpy.array_equal(grandparents, parents):
+			return
+
+		parents[:] = grandparents
+
+def JoinLabels(parents, roots1, roots2):
+	# Join the sets of roots1[i] and roots2[i] for every i, in a compressed union-find forest.  Each root is hooked under
+	# the smallest root that it is joined to, so the hooks never form a cycle; this is repeated until every pair is in the same set.
+
+	while len(roots1) > 0:
+		roots1 = parents[roots1]
+		roots2 = parents[roots2]
+		different = roots1 != roots2
+		roots1 = roots1[different]
+		roots2 = roots2[different]
+
+		if len(roots1) == 0:
+			return
+
+		numpy.minimum.at(parents, numpy.maximum(roots1, roots2), numpy.minimum(roots1, roots2))
+		CompressLabels(parents)
+
+def ToArray(typecode, values):
+	# Copy a NumPy array into an array.array, so that the labyrinth does not depend on NumPy once it has been generated.
+	return array(typecode, values.astype(numpy.dtype(typecode).newbyteorder('=')).tobytes())
+
+class NumpyLabyrinthGenerator(LabyrinthBase):
+	def __init__(self, numberOfLevels, numberOfRoomsPerLevel, reporter = None, seed = None):
+
+		if numberOfLevels < 2 or numberOfRoomsPerLevel < 4:
+			raise Exception('NumpyLabyrinthGenerator.__init__(): Invalid parameter(s).')
+
+		LabyrinthBase.__init__(self, numberOfLevels, numberOfRoomsPerLevel, reporter, seed)
+		self.numpyRandom = numpy.random.default_rng(self.seed)	# The books and Jorge use self.random, as in LabyrinthGenerator.
+		self.numberOfAttemptsToRefactor = 0
+		self.numberOfAttemptsToRefactorWithoutProgress = 0	# As in LabyrinthGenerator.JoinBlobs().
+		self.maximumNumberOfAttemptsToRefactorWithoutProgress = 100
+		self.fewestDifferentLabelsWhenRefactoring = None
+		self.conflictCounts = [0, 0, 0]	# The number of conflicting connections of Types 1, 2 and 3 removed while refactoring.
+		self.BuildSlots()
+
+	def BuildSlots(self):
+		H = self.numberOfRoomsPerLevel - 1
+		a = numpy.arange(H)
+		numberOfGaps = self.numberOfLevels - 1
+		hubs = numpy.full(H, H)
+		lowerRoomNumbers = numpy.concatenate((a, a, a, hubs))
+		upperRoomNumbers = numpy.concatenate(((a + 1) % H, (a - 1) % H, hubs, a))
+		self.numberOfSlotsPerGap = 4 * H
+		self.partners = numpy.concatenate(((a + 1) % H + H, (a - 1) % H, a + 3 * H, a + 2 * H))
+		# Each slot and its partner share a "pair" number, so that neighbourhoods of conflicting slots can be found.
+		self.pairs = numpy.concatenate((a, (a - 1) % H, a + H, a + H))
+		self.numberOfPairsPerGap = 2 * H
+
+		firstRoomsOnLevels = numpy.arange(numberOfGaps, dtype = numpy.int32)[:, None] * self.numberOfRoomsPerLevel
+		self.lowerRooms = (firstRoomsOnLevels + lowerRoomNumbers).astype(numpy.int32).ravel()
+		self.upperRooms = (firstRoomsOnLevels + self.numberOfRoomsPerLevel + upperRoomNumbers).astype(numpy.int32).ravel()
+		self.connected = numpy.zeros(numberOfGaps * self.numberOfSlotsPerGap, dtype = bool)
+
+	def FindConflicts(self):
+		# Return a boolean array that tells, for each slot, whether a connection there would conflict with an existing connection.
+		connected = self.connected.reshape(-1, self.numberOfSlotsPerGap)
+		partnerConnected = connected[:, self.partners]
+		conflicts = partnerConnected.copy()
+		conflicts[1:] |= partnerConnected[:-1]
+		conflicts[:-1] |= partnerConnected[1:]
+		return conflicts.ravel()
+
+	def KeepLocalMinima(self, slots, priorities, radius):
+		# Return a mask of the given slots whose priority is the lowest among the given slots of the same pair within radius gaps.
+		# No two slots that are kept can then conflict (for a radius of at least 1).
+		numberOfGaps = self.numberOfLevels - 1
+		unused = len(self.connected)
+		pairPriorities = numpy.full((numberOfGaps, self.numberOfPairsPerGap), unused, dtype = numpy.int64)
+		gaps, slotNumbers = numpy.divmod(slots, self.numberOfSlotsPerGap)
+		pairNumbers = self.pairs[slotNumbers]
+		numpy.minimum.at(pairPriorities, (gaps, pairNumbers), priorities)
+		minima = pairPriorities.copy()
+
+		for shift in range(1, radius + 1):
+			minima[shift:] = numpy.minimum(minima[shift:], pairPriorities[:-shift])
+			minima[:-shift] = numpy.minimum(minima[:-shift], pairPriorities[shift:])
+
+		return priorities == minima[gaps, pairNumbers]
+
+	def ChooseJoins(self, slots, labels):
+		# Give the slots random priorities, and return those that are the lowest-priority slot of the blob at either end.
+		priorities = self.numpyRandom.permutation(len(slots))
+		lowerLabels = labels[self.lowerRooms[slots]]
+		upperLabels = labels[self.upperRooms[slots]]
+		lowestPriorities = numpy.full(self.numberOfRooms, len(slots), dtype = numpy.int64)
+		numpy.minimum.at(lowestPriorities, lowerLabels, priorities)
+		numpy.minimum.at(lowestPriorities, upperLabels, priorities)
+		chosen = (priorities == lowestPriorities[lowerLabels]) | (priorities == lowestPriorities[upperLabels])
+		return (slots[chosen], priorities[chosen])
+
+	def Connect(self, slots, labels):
+		self.connected[slots] = True
+		JoinLabels(labels, labels[self.lowerRooms[slots]], labels[self.upperRooms[slots]])
+
+	def Refactor(self, slots, labels):
+		# Every slot in slots joins two blobs, but conflicts with an existing connection.
+		# Remove the conflicting connections of some of these slots (far enough apart not to interfere), connect them, and relabel.
+		self.reporter.Report('refactoring', "Refactoring...", attempt = self.numberOfAttemptsToRefactor)
+		slots, priorities = self.ChooseJoins(slots, labels)
+		slots = slots[self.KeepLocalMinima(slots, priorities, 2)]
+		gaps, slotNumbers = numpy.divmod(slots, self.numberOfSlotsPerGap)
+		partners = self.partners[slotNumbers]
+		numberOfGaps = self.numberOfLevels - 1
+
+		for gapOffset, conflictType in ((0, 1), (-1, 2), (1, 3)):
+			conflictGaps = gaps + gapOffset
+			inside = (conflictGaps >= 0) & (conflictGaps < numberOfGaps)
+			conflictingSlots = conflictGaps[inside] * self.numberOfSlotsPerGap + partners[inside]
+			conflictingSlots = conflictingSlots[self.connected[conflictingSlots]]
+
+			if len(conflictingSlots) > 0:
+				self.conflictCounts[conflictType - 1] += len(conflictingSlots)
+				self.reporter.Report('conflict', "Found " + str(len(conflictingSlots)) + " Type " + str(conflictType) + " conflict(s).",
+					conflictType = conflictType, count = len(conflictingSlots))
+
+			self.connected[conflictingSlots] = False
+
+		self.connected[slots] = True
+
+		# Removing connections splits blobs, so the labels are rebuilt from scratch.
+		labels[:] = numpy.arange(self.numberOfRooms, dtype = numpy.int32)
+		connectedSlots = numpy.flatnonzero(self.connected)
+		JoinLabels(labels, self.lowerRooms[connectedSlots], self.upperRooms[connectedSlots])
+
+	def Generate(self):
+		labels = numpy.arange(self.numberOfRooms, dtype = numpy.int32)	# A compressed union-find forest: the label of a room is the root of its blob.
+
+		while True:
+			unconnectedSlots = numpy.flatnonzero(~self.connected)
+			joiningSlots = unconnectedSlots[labels[self.lowerRooms[unconnectedSlots]] != labels[self.upperRooms[unconnectedSlots]]]
+
+			if len(joiningSlots) == 0:
+				break	# There is only one blob.
+
+			slots = joiningSlots[~self.FindConflicts()[joiningSlots]]
+
+			if len(slots) == 0:
+				# The connections form a forest, so the number of blobs is the number of rooms less the number of connections.
+				numberOfDifferentLabels = self.numberOfRooms - numpy.count_nonzero(self.connected)
+
+				if self.fewestDifferentLabelsWhenRefactoring == None or numberOfDifferentLabels < self.fewestDifferentLabelsWhenRefactoring:
+					self.fewestDifferentLabelsWhenRefactoring = numberOfDifferentLabels
+					self.numberOfAttemptsToRefactorWithoutProgress = 0
+				elif self.numberOfAttemptsToRefactorWithoutProgress >= self.maximumNumberOfAttemptsToRefactorWithoutProgress:
+					raise Exception("Refactored " + str(self.numberOfAttemptsToRefactorWithoutProgress) + " times in a row without reducing the number of blobs below " +
+						str(self.fewestDifferentLabelsWhenRefactoring) + " (" + str(self.numberOfAttemptsToRefactor) + " refactorings in all).")
+
+				self.numberOfAttemptsToRefactor += 1
+				self.numberOfAttemptsToRefactorWithoutProgress += 1
+				self.Refactor(joiningSlots, labels)
+				continue
+
+			slots, priorities = self.ChooseJoins(slots, labels)
+			self.Connect(slots[self.KeepLocalMinima(slots, priorities, 1)], labels)
+
+		self.BuildConnections()
+		self.Report()
+		self.PrintLongestPath()		# This sets roomGoal.
+		self.PlaceBooksInRooms()	# This uses roomGoal.
+		self.reporter.Report('summary', None, numberOfAttemptsToRefactor = self.numberOfAttemptsToRefactor, conflictCounts = list(self.conflictCounts))
+
+	def BuildConnections(self):
+		# Build the connections in compressed sparse row form (see AdjacencyStore.CompactAdjacency), with the neighbours of each room in increasing order,
+		# and a DistanceOracle rooted at room 0 from a vectorized breadth-first search.
+		connectedSlots = numpy.flatnonzero(self.connected)
+		rooms = numpy.concatenate((self.lowerRooms[connectedSlots], self.upperRooms[connectedSlots]))
+		neighbours = numpy.concatenate((self.upperRooms[connectedSlots], self.lowerRooms[connectedSlots]))
+		order = numpy.lexsort((neighbours, rooms))
+		self.targets = neighbours[order]
+		self.offsets = numpy.zeros(self.numberOfRooms + 1, dtype = numpy.int64)
+		numpy.cumsum(numpy.bincount(rooms, minlength = self.numberOfRooms), out = self.offsets[1:])
+		self.connections = CompactAdjacency(self.numberOfLevels, self.numberOfRoomsPerLevel, ToArray('I', self.offsets), ToArray('I', self.targets))
+
+		parents, depths, jumps, lastRoom, depth = self.BreadthFirstSearch(0, True)
+		self.distanceOracle = DistanceOracle(self.connections, 0, (ToArray('i', parents), ToArray('i', depths), ToArray('i', jumps)))
+		self.treeAnalytics = TreeAnalytics(self.distanceOracle, self.ComputeTreeAnalytics(parents, depths, depth))
+
+	def ComputeTreeAnalytics(self, parents, depths, maximumDepth):
+		# The arrays of a TreeAnalytics, computed one ring of rooms at a time (as the rings of a breadth-first search) instead of one room at a time.
+		order = numpy.argsort(depths, kind = 'stable').astype(numpy.int32)
+		starts = numpy.searchsorted(depths[order], numpy.arange(maximumDepth + 2))
+		heights = numpy.zeros(self.numberOfRooms, dtype = numpy.int32)
+
+		for depth in range(maximumDepth, 0, -1):
+			ring = order[starts[depth]:starts[depth + 1]]
+			numpy.maximum.at(heights, parents[ring], heights[ring] + 1)
+
+		# The tallest child of each room is the first of its children in order of decreasing height; the second height of a room is
+		# the height reached through any of its other children.
+		children = order[1:]	# Every room but the root.
+		childParents = parents[children]
+		childHeights = heights[children] + 1
+		byParent = numpy.lexsort((-childHeights, childParents))
+		isTallest = numpy.ones(len(children), dtype = bool)
+		isTallest[1:] = childParents[byParent[1:]] != childParents[byParent[:-1]]
+		tallestChildren = numpy.full(self.numberOfRooms, -1, dtype = numpy.int32)
+		tallestChildren[childParents[byParent[isTallest]]] = children[byParent[isTallest]]
+		otherHeights = childHeights.copy()
+		otherHeights[byParent[isTallest]] = 0
+		secondHeights = numpy.zeros(self.numberOfRooms, dtype = numpy.int32)
+		numpy.maximum.at(secondHeights, childParents, otherHeights)
+
+		# The diameter, from the end of its tallest branch, through the room at which it turns, to the end of its other branch (if any).
+		diameterPeak = int(numpy.argmax(heights + secondHeights))
+		diameterPath = []
+		room = diameterPeak
+
+		while room >= 0:
+			diameterPath.append(room)
+			room = int(tallestChildren[room])
+
+		diameterPath.reverse()
+		otherChildren = numpy.flatnonzero((childParents == diameterPeak) & (children != tallestChildren[diameterPeak]))
+
+		if len(otherChildren) > 0:
+			room = int(children[otherChildren[numpy.argmax(childHeights[otherChildren])]])
+
+			while room >= 0:
+				diameterPath.append(room)
+				room = int(tallestChildren[room])
+
+		# From the root down: the longest path that leaves each room through its parent, and so the eccentricity of each room.
+		upHeights = numpy.zeros(self.numberOfRooms, dtype = numpy.int32)
+
+		for depth in range(1, maximumDepth + 1):
+			ring = order[starts[depth]:starts[depth + 1]]
+			ringParents = parents[ring]
+			siblingHeights = numpy.where(tallestChildren[ringParents] == ring, secondHeights[ringParents], heights[ringParents])
+			upHeights[ring] = numpy.maximum(upHeights[ringParents], siblingHeights) + 1
+
+		eccentricities = numpy.maximum(heights, upHeights)
+		return (ToArray('i', order), ToArray('i', heights), ToArray('i', eccentricities), array('i', diameterPath))
+
+	def BreadthFirstSearch(self, room, buildJumps = False):
+		# A breadth-first search of the tree, one ring of rooms at a time.  Return the parents and depths of the rooms (and their
+		# jump pointers, as in DistanceOracle.BuildTree(), if buildJumps is True), the last room reached and its depth.
+		offsets = self.offsets
+		parents = numpy.full(self.numberOfRooms, -1, dtype = numpy.int32)
+		depths = numpy.zeros(self.numberOfRooms, dtype = numpy.int32)
+		jumps = None
+		parents[room] = room
+		ring = numpy.array([room], dtype = numpy.int64)
+		depth = 0
+
+		if buildJumps:
+			jumps = numpy.zeros(self.numberOfRooms, dtype = numpy.int32)
+			jumps[room] = room
+
+		while True:
+			starts = offsets[ring]
+			counts = offsets[ring + 1] - starts
+			numberOfNeighbours = int(counts.sum())
+			# The positions in targets of the neighbours of every room in the ring.
+			positions = numpy.arange(numberOfNeighbours) + numpy.repeat(starts - (numpy.cumsum(counts) - counts), counts)
+			nextRing = self.targets[positions]
+			ringParents = numpy.repeat(ring, counts)
+			unvisited = parents[nextRing] < 0
+			nextRing = nextRing[unvisited]
+			ringParents = ringParents[unvisited]
+
+			if len(nextRing) == 0:
+				return (parents, depths, jumps, int(ring[-1]), depth)
+
+			depth += 1
+			parents[nextRing] = ringParents
+			depths[nextRing] = depth
+
+			if buildJumps:
+				jump = jumps[ringParents]
+				skip = depths[ringParents] - depths[jump] == depths[jump] - depths[jumps[jump]]
+				jumps[nextRing] = numpy.where(skip, jumps[jump], ringParents)
+
+			ring = nextRing
+
+	def Report(self):
+
+		if self.reporter.IsEnabledFor('connection'):
+
+			for room in self.rooms:
+
+				for otherRoom in self.connections.Neighbours(room):
+					self.reporter.Report('connection', self.RoomToString(room) + " to " + self.RoomToString(otherRoom), room1 = room, room2 = otherRoom)
+
+		if self.numberOfAttemptsToRefactor > 0:
+			self.reporter.Report('refactorCount', "The labyrinth was refactored " + str(self.numberOfAttemptsToRefactor) + " time(s).",
+				numberOfAttemptsToRefactor = self.numberOfAttemptsToRefactor)
+
+		if int(numpy.count_nonzero(self.connected)) != self.numberOfRooms - 1:
+			raise Exception("The labyrinth is in multiple blobs.")
+
+		self.reporter.Report('singleBlob', "The labyrinth is a single blob.")
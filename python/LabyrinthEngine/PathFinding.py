@@ -0,0 +1,119 @@
+# PathFinding.py
+
+# Breadth-first searches over the connections of a labyrinth.
+# The "connections" argument may be any object with a Neighbours(room) method, such as an AdjacencyStore.
+
+from collections import deque
+
+def BuildPath(parents, room):
+	# Follow the parent pointers back from the given room to the room where the search started.
+	path = []
+
+	while room != None:
+		path.append(room)
+		room = parents[room]
+
+	path.reverse()
+	return path
+
+def FindShortestPath(connections, room, roomGoal):
+	# Return a shortest path (a list of rooms) from room to roomGoal.
+	# If roomGoal is None (or cannot be reached), return a path from room to the last room reached, which is as far from room as any room can be.
+	parents = {room: None}	# parents.keys() is the union of the open list and the closed list.
+	openList = deque([room])
+
+	if room == roomGoal:
+		return [room]
+
+	while len(openList) > 0:
+		room = openList.popleft()
+
+		for room2 in connections.Neighbours(room):
+
+			if not room2 in parents:
+				parents[room2] = room
+
+				if room2 == roomGoal:
+					return BuildPath(parents, room2)
+
+				openList.append(room2)
+
+	# Here, room is the last room to be dequeued (and thus the last room to be enqueued).
+	return BuildPath(parents, room)
+
+# The searches below only track distances; they never build a path.  They proceed one "ring" of rooms at a time,
+# where every room in a ring is at the same distance from the starting room.
+
+def FindDistances(connections, room, maximumDistance = None):
+	# Return a dictionary that maps each room within maximumDistance of the given room (or each reachable room) to its distance from that room.
+	distances = {room: 0}
+	ring = [room]
+	distance = 0
+
+	while len(ring) > 0 and (maximumDistance == None or distance < maximumDistance):
+		distance += 1
+		nextRing = []
+
+		for room1 in ring:
+
+			for room2 in connections.Neighbours(room1):
+
+				if not room2 in distances:
+					distances[room2] = distance
+					nextRing.append(room2)
+
+		ring = nextRing
+
+	return distances
+
+def FindDistance(connections, room, roomGoal, maximumDistance = None):
+	# Return the distance from room to roomGoal, or None if roomGoal is further away than maximumDistance (or cannot be reached).
+	visited = set([room])
+	ring = [room]
+	distance = 0
+
+	if room == roomGoal:
+		return distance
+
+	while len(ring) > 0 and (maximumDistance == None or distance < maximumDistance):
+		distance += 1
+		nextRing = []
+
+		for room1 in ring:
+
+			for room2 in connections.Neighbours(room1):
+
+				if not room2 in visited:
+
+					if room2 == roomGoal:
+						return distance
+
+					visited.add(room2)
+					nextRing.append(room2)
+
+		ring = nextRing
+
+	return None
+
+def FindFarthestRoom(connections, room):
+	# Return a (farthestRoom, distance) tuple, where farthestRoom is the last room reached by a breadth-first search from the given room.
+	visited = set([room])
+	ring = [room]
+	distance = -1
+
+	while True:
+		distance += 1
+		nextRing = []
+
+		for room1 in ring:
+
+			for room2 in connections.Neighbours(room1):
+
+				if not room2 in visited:
+					visited.add(room2)
+					nextRing.append(room2)
+
+		if len(nextRing) == 0:
+			return (ring[len(ring) - 1], distance)
+
+		ring = nextRing
@@ -0,0 +1,74 @@
+# PossibleNeighbours.py
+
+# The "possible neighbours" of a room are the rooms that it may ever be connected to: on each adjacent level, the rooms on either side
+# of it and the hub (numberOfRoomsPerLevel - 1), or, for the hub itself, every other room.  The lower level comes first.
+# They depend only on the dimensions of the labyrinth, so they are computed once, in compressed sparse row form
+# (the possible neighbours of room r are targets[offsets[r]:offsets[r + 1]]), and the table is shared by every generator
+# and AdjacencyStore with the same dimensions.
+
+# Each pair of possible neighbours is also given a "slot" number, so that every pair can be enumerated (or sampled) once, without the table:
+# the 4 * (numberOfRoomsPerLevel - 1) slots of each gap between two levels are numbered as in NumpyLabyrinth, and GetSlot() maps a slot
+# to its pair of rooms in O(1).
+
+import functools
+from array import array
+
+def GeneratePossibleNeighboursOnLevel(numberOfRoomsPerLevel, roomNumber, newLevel, result):
+	firstRoomOnLevel = newLevel * numberOfRoomsPerLevel
+	hubRoomNumber = numberOfRoomsPerLevel - 1
+
+	if roomNumber == hubRoomNumber:
+		result.extend(range(firstRoomOnLevel, firstRoomOnLevel + hubRoomNumber))
+	else:
+		result.append(firstRoomOnLevel + (roomNumber + 1) % hubRoomNumber)
+		result.append(firstRoomOnLevel + (roomNumber + hubRoomNumber - 1) % hubRoomNumber)
+		result.append(firstRoomOnLevel + hubRoomNumber)
+
+class PossibleNeighbourTable:
+	def __init__(self, numberOfLevels, numberOfRoomsPerLevel):
+		self.numberOfRoomsPerLevel = numberOfRoomsPerLevel
+		self.numberOfSlots = (numberOfLevels - 1) * 4 * (numberOfRoomsPerLevel - 1)
+		self.offsets = array('I', [0])
+		self.targets = array('I')
+
+		for levelNumber in range(0, numberOfLevels):
+
+			for roomNumber in range(0, numberOfRoomsPerLevel):
+
+				if levelNumber > 0:
+					GeneratePossibleNeighboursOnLevel(numberOfRoomsPerLevel, roomNumber, levelNumber - 1, self.targets)
+
+				if levelNumber < numberOfLevels - 1:
+					GeneratePossibleNeighboursOnLevel(numberOfRoomsPerLevel, roomNumber, levelNumber + 1, self.targets)
+
+				self.offsets.append(len(self.targets))
+
+		self.targetsView = memoryview(self.targets)
+
+	def Get(self, room):
+		# Return the possible neighbours of the given room, as a read-only view into the table (no list is allocated).
+		return self.targetsView[self.offsets[room]:self.offsets[room + 1]]
+
+	def GetPossibleNeighbour(self, room, index):
+		return self.targets[self.offsets[room] + index]
+
+	def GetSlot(self, slot):
+		# Return the (lowerRoom, upperRoom) pair of possible neighbours in the given slot.
+		hubRoomNumber = self.numberOfRoomsPerLevel - 1
+		levelNumber, slotOnLevel = divmod(slot, 4 * hubRoomNumber)
+		slotType, roomNumber = divmod(slotOnLevel, hubRoomNumber)
+		firstLowerRoom = levelNumber * self.numberOfRoomsPerLevel
+		firstUpperRoom = firstLowerRoom + self.numberOfRoomsPerLevel
+
+		if slotType == 0:
+			return (firstLowerRoom + roomNumber, firstUpperRoom + (roomNumber + 1) % hubRoomNumber)
+		elif slotType == 1:
+			return (firstLowerRoom + roomNumber, firstUpperRoom + (roomNumber + hubRoomNumber - 1) % hubRoomNumber)
+		elif slotType == 2:
+			return (firstLowerRoom + roomNumber, firstUpperRoom + hubRoomNumber)
+		else:
+			return (firstLowerRoom + hubRoomNumber, firstUpperRoom + roomNumber)
+
+@functools.lru_cache(maxsize = 16)
+def GetPossibleNeighbourTable(numberOfLevels, numberOfRoomsPerLevel):
+	return PossibleNeighbourTable(numberOfLevels, numberOfRoomsPerLevel)
@@ -0,0 +1,87 @@
+# Reporting.py
+
+# The generator reports on its progress through a "reporter" instead of printing directly.
+# Each report is an event: a name, a message for people to read (or None), and some named values.
+
+# The events are:
+#   "connection" (room1, room2): one for each direction of each connection in the finished labyrinth.
+#   "refactoring" (attempt), "conflict" (conflictType: 1, 2 or 3), "refactorCount" (numberOfAttemptsToRefactor),
+#   "singleBlob", "longestPath" (numberOfRooms, spanningTree: True if extra connections have been added, so that the path is the longest
+#   in the spanning tree that they were added to), "pathToGoal" (numberOfRooms),
+#   "extraConnection" (room1, room2): one for each extra connection added; "extraConnections" (numberOfExtraConnections, numberOfExtraConnectionsAdded),
+#   "summary" (numberOfAttemptsToRefactor, conflictCounts): no message; sent once at the end of generation.
+
+# The generator asks IsEnabledFor() before building a message that is expensive to build (or that there are many of),
+# so a reporter that ignores an event costs almost nothing.
+
+class ConsoleReporter:
+	# Prints the messages, as the generator always used to.  This is the default.
+	eventsPrecededByABlankLine = ('longestPath', 'pathToGoal')
+
+	def IsEnabledFor(self, eventName):
+		return True
+
+	def Report(self, eventName, message, **values):
+
+		if message == None:
+			return
+
+		if eventName in self.eventsPrecededByABlankLine:
+			print()
+
+		print(message)
+
+class QuietReporter:
+	# Ignores everything.
+
+	def IsEnabledFor(self, eventName):
+		return False
+
+	def Report(self, eventName, message, **values):
+		pass
+
+class LoggingReporter:
+	# Passes the messages to a logger: the connections (and extra connections) at the DEBUG level, and everything else at the INFO level.
+
+	def __init__(self, logger = None):
+		import logging	# Imported here rather than at the top, so that importing the engine (e.g. in a worker process) stays cheap.
+
+		if logger == None:
+			logger = logging.getLogger('Labyrinth')
+
+		self.logger = logger
+		self.connectionLevel = logging.DEBUG
+		self.level = logging.INFO
+
+	def GetLevel(self, eventName):
+
+		if eventName == 'connection' or eventName == 'extraConnection':
+			return self.connectionLevel
+
+		return self.level
+
+	def IsEnabledFor(self, eventName):
+		return self.logger.isEnabledFor(self.GetLevel(eventName))
+
+	def Report(self, eventName, message, **values):
+
+		if message != None:
+			self.logger.log(self.GetLevel(eventName), message)
+
+class EventReporter:
+	# Counts the events of each kind, and passes each event (except the connections, unless asked to) to an optional callback
+	# as callback(eventName, values), where values is a dictionary.  No message is ever built for the connections unless they are wanted.
+
+	def __init__(self, callback = None, includeConnections = False):
+		self.callback = callback
+		self.includeConnections = includeConnections
+		self.counts = {}	# Maps event names to the number of times each event was reported.
+
+	def IsEnabledFor(self, eventName):
+		return self.includeConnections or eventName != 'connection'
+
+	def Report(self, eventName, message, **values):
+		self.counts[eventName] = self.counts.get(eventName, 0) + 1
+
+		if self.callback != None:
+			self.callback(eventName, values)
@@ -0,0 +1,20 @@
+# Sampling.py
+
+# Random sampling without replacement.
+
+# RandomOrder() is a lazy Fisher-Yates shuffle: it yields the items of a sequence in a random order, drawing one random number per item.
+# The shuffle is not done in place: only the positions that have been swapped are recorded (in a dictionary), so the sequence
+# (which may be a range) is neither copied nor modified, each item costs O(1), and stopping early costs nothing for the items not yet drawn.
+# For a given state of the random number generator, the order is always the same.
+
+import random
+
+def RandomOrder(items, randomNumberGenerator = random):
+	swappedPositions = {}	# Maps each position that has been swapped to the position of the item that is now there.
+
+	for numberOfItemsLeft in range(len(items), 0, -1):
+		position = randomNumberGenerator.randint(0, numberOfItemsLeft - 1)
+		lastPosition = numberOfItemsLeft - 1
+		item = items[swappedPositions.get(position, position)]
+		swappedPositions[position] = swappedPositions.get(lastPosition, lastPosition)
+		yield item
@@ -0,0 +1,243 @@
+# StreamingGeneration.py
+
+# Generates a labyrinth that is too large to hold in memory, a band of levels at a time, writing each level to a labyrinth file
+# (see LabyrinthFile) as soon as it is finished.  Memory use depends on the number of levels in a band, not on the number of levels.
+# A band holds (levelsPerBand + 2) * numberOfRoomsPerLevel rooms, so it is the width of the levels that limits the size of the band:
+# with wide levels, choose a smaller levelsPerBand.  The number of refactorings that a band needs grows with its number of rooms
+# (130 levels of 1000 rooms, in bands of 64 levels, need about 350 refactorings in all); that number is not limited as such,
+# since generation only gives up after many refactorings in a row that make no progress (see LabyrinthGenerator.JoinBlobs()).
+
+# This works because connections only ever join adjacent levels, and the conflict tests only ever look one level further.
+# Each band is generated by a BandGenerator, which is a LabyrinthGenerator whose two lowest levels are "frozen": they are the two highest
+# levels of the previous band, with the connections between them.  The frozen rooms are all given the same label at the start,
+# since every room generated so far is connected to them (the blob-connectivity summary of the levels below is a single blob),
+# and generation within the band stops, as usual, when there is only one blob.  The frozen connections are only there for the conflict tests;
+# they are never removed, and the frozen rooms never go on the open list.  So, band by band, the labyrinth stays one tree that obeys the rules.
+
+# The file is written in place: the offsets and the targets of the connections are written at positions that are known in advance
+# (a tree of n rooms has n - 1 connections), and the header, with roomGoal and the books, at the end.
+# The file has no DistanceOracle arrays (they would need the whole tree); MappedLabyrinth builds an oracle when one is first needed.
+# The goal is the room farthest from the room (0, 0), which in a tree is one end of a longest path; the depth of each room is found
+# band by band, from the frozen rooms upwards.  The books are placed as LabyrinthBase.PlaceBooksInRooms() places them.
+
+from array import array
+from . import LabyrinthFile
+from .Labyrinth import LabyrinthBase, LabyrinthGenerator
+
+class BandGenerator(LabyrinthGenerator):
+	# If frozenConnections (a list of (room1, room2) tuples between band levels 0 and 1) is None, the band is the first one, and nothing is frozen.
+
+	def __init__(self, numberOfLevels, numberOfRoomsPerLevel, reporter, randomNumberGenerator, frozenConnections = None):
+		LabyrinthGenerator.__init__(self, numberOfLevels, numberOfRoomsPerLevel, reporter, 0)
+		self.random = randomNumberGenerator	# Shared by all of the bands.
+		self.numberOfFrozenRooms = 0
+
+		if frozenConnections != None:
+			self.numberOfFrozenRooms = 2 * numberOfRoomsPerLevel
+
+			for room1, room2 in frozenConnections:
+				self.connections.Connect(room1, room2)
+
+			for room in range(1, self.numberOfFrozenRooms):
+				self.roomLabels.Union(0, room)
+
+	def CanRefactorPair(self, room1, room2):
+		# A pair between band levels 1 and 2 must not be joined if it conflicts with a frozen connection (a Type 2 conflict, with band level 0).
+
+		if not LabyrinthGenerator.CanRefactorPair(self, room1, room2):
+			return False
+
+		lowerRoom = min(room1, room2)
+		upperRoom = max(room1, room2)
+
+		if self.numberOfFrozenRooms > 0 and lowerRoom // self.numberOfRoomsPerLevel == 1:
+			return not self.connections.AreConnected(lowerRoom, upperRoom % self.numberOfRoomsPerLevel)
+
+		return True
+
+	def DetachSmallerPart(self, room1, room2):
+		# As in LabyrinthGenerator, except that a part that reaches a frozen room is connected (through the levels below the band)
+		# to every other frozen room, so the other part is the one that is detached, however large it is.
+		# Both parts cannot reach a frozen room, since the labyrinth is a tree.
+		stacks = ([room1], [room2])
+		roomsReached = (set([room1]), set([room2]))
+		parts = ([], [])
+		side = 0
+		frozenSide = None
+
+		while len(stacks[side]) > 0:
+			room = stacks[side].pop()
+
+			if room < self.numberOfFrozenRooms:
+				frozenSide = side
+				side = 1 - side
+				continue
+
+			parts[side].append(room)
+
+			for otherRoom in self.connections.Neighbours(room):
+
+				if not otherRoom in roomsReached[side]:
+					roomsReached[side].add(otherRoom)
+					stacks[side].append(otherRoom)
+
+			if frozenSide == None:
+				side = 1 - side
+
+		self.openList.Extend(parts[side])
+		return self.roomLabels.Detach(parts[side])
+
+	def Generate(self):
+		self.numberOfDifferentLabels = self.roomLabels.numberOfSets
+		self.openList.Extend(range(self.numberOfFrozenRooms, self.numberOfRooms))
+		self.JoinBlobs()
+
+	def FindDepths(self, sourceDepths):
+		# Return the distance from the room (0, 0) of every room above the frozen levels (and of the sources), given those of the sources
+		# (a list of (room, depth) tuples: the room (0, 0) in the first band, or the rooms on band level 1).  The other rooms get -1.
+		depths = array('i', [-1]) * self.numberOfRooms
+		stack = []
+
+		for room, depth in sourceDepths:
+			depths[room] = depth
+			stack.append(room)
+
+		while len(stack) > 0:
+			room = stack.pop()
+
+			for otherRoom in self.connections.Neighbours(room):
+
+				if depths[otherRoom] < 0 and otherRoom >= self.numberOfFrozenRooms:
+					depths[otherRoom] = depths[room] + 1
+					stack.append(otherRoom)
+
+		return depths
+
+class StreamingLabyrinthGenerator(LabyrinthBase):
+	# Generate() writes the labyrinth to the file at the given path; the labyrinth itself is not kept (self.connections stays None),
+	# so load the file (LabyrinthFile.LoadLabyrinth()) to navigate it.  Each band adds levelsPerBand levels (the last band may add fewer).
+
+	def __init__(self, numberOfLevels, numberOfRoomsPerLevel, path, reporter = None, seed = None, levelsPerBand = 64):
+
+		if numberOfLevels < 2 or numberOfRoomsPerLevel < 4 or levelsPerBand < 3:
+			raise Exception('StreamingLabyrinthGenerator.__init__(): Invalid parameter(s).')
+
+		LabyrinthBase.__init__(self, numberOfLevels, numberOfRoomsPerLevel, reporter, seed)
+		self.path = path
+		self.levelsPerBand = levelsPerBand
+		self.numberOfBands = 0
+		self.numberOfAttemptsToRefactor = 0
+		self.conflictCounts = [0, 0, 0]
+		self.goalDepth = -1
+
+	def WriteLevels(self, outputFile, band, firstLevelNumber, firstBandLevel, lastBandLevel):
+		# Write the connections of the rooms on the given band levels; firstLevelNumber is the level number of band level 0.
+		numberOfRoomsPerLevel = self.numberOfRoomsPerLevel
+		firstRoom = firstLevelNumber * numberOfRoomsPerLevel
+		offsets = array('I')
+		targets = array('I')
+
+		for room in range(firstBandLevel * numberOfRoomsPerLevel, (lastBandLevel + 1) * numberOfRoomsPerLevel):
+			targets.extend(sorted(firstRoom + otherRoom for otherRoom in band.connections.Neighbours(room)))
+			offsets.append(self.numberOfTargetsWritten + len(targets))
+
+		outputFile.seek(self.offsetsPosition + 4 * (self.numberOfRoomsWritten + 1))
+		outputFile.write(LabyrinthFile.ArrayToBytes(offsets))
+		outputFile.seek(self.targetsPosition + 4 * self.numberOfTargetsWritten)
+		outputFile.write(LabyrinthFile.ArrayToBytes(targets))
+		self.numberOfRoomsWritten += len(offsets)
+		self.numberOfTargetsWritten += len(targets)
+
+	def FindGoal(self, band, depths, firstLevelNumber):
+
+		for room in range(band.numberOfFrozenRooms, band.numberOfRooms):
+
+			if depths[room] < 0:
+				raise Exception('StreamingLabyrinthGenerator.FindGoal(): The band is not connected to the levels below it.')
+
+			if depths[room] > self.goalDepth:
+				self.goalDepth = depths[room]
+				self.roomGoal = firstLevelNumber * self.numberOfRoomsPerLevel + room
+
+	def Generate(self):
+		numberOfRoomsPerLevel = self.numberOfRoomsPerLevel
+		numberOfConnections = 2 * (self.numberOfRooms - 1)	# Each connection is counted once in each direction.
+		self.offsetsPosition = LabyrinthFile.header.size
+		self.targetsPosition = self.offsetsPosition + 4 * (self.numberOfRooms + 1)
+		self.numberOfRoomsWritten = 0
+		self.numberOfTargetsWritten = 0
+
+		with open(self.path, 'w+b') as outputFile:
+			outputFile.write(bytes(LabyrinthFile.header.size))
+			outputFile.write(LabyrinthFile.ArrayToBytes(array('I', [0])))	# The first offset.
+
+			firstLevelNumber = 0
+			frozenConnections = None
+			sourceDepths = [(0, 0)]
+
+			while True:
+
+				if frozenConnections == None:
+					numberOfBandLevels = min(self.levelsPerBand, self.numberOfLevels)
+				else:
+					numberOfBandLevels = min(2 + self.levelsPerBand, self.numberOfLevels - firstLevelNumber)
+
+				isLastBand = firstLevelNumber + numberOfBandLevels == self.numberOfLevels
+				band = BandGenerator(numberOfBandLevels, numberOfRoomsPerLevel, self.reporter, self.random, frozenConnections)
+				band.Generate()
+				self.numberOfBands += 1
+				self.numberOfAttemptsToRefactor += band.numberOfAttemptsToRefactor
+
+				for i in range(0, 3):
+					self.conflictCounts[i] += band.conflictCounts[i]
+
+				depths = band.FindDepths(sourceDepths)
+				self.FindGoal(band, depths, firstLevelNumber)
+
+				# Band level 0 has already been written (unless this is the first band), and the highest band level is frozen in the next band,
+				# unless this is the last band.
+				firstBandLevel = 0
+
+				if frozenConnections != None:
+					firstBandLevel = 1
+
+				if isLastBand:
+					self.WriteLevels(outputFile, band, firstLevelNumber, firstBandLevel, numberOfBandLevels - 1)
+					break
+
+				self.WriteLevels(outputFile, band, firstLevelNumber, firstBandLevel, numberOfBandLevels - 2)
+
+				# The next band starts with the two highest levels of this one.
+				nextFirstRoom = (numberOfBandLevels - 2) * numberOfRoomsPerLevel
+				frozenConnections = []
+
+				for room in range(nextFirstRoom, nextFirstRoom + numberOfRoomsPerLevel):
+
+					for otherRoom in band.connections.Neighbours(room):
+
+						if otherRoom > room:
+							frozenConnections.append((room - nextFirstRoom, otherRoom - nextFirstRoom))
+
+				sourceDepths = [(numberOfRoomsPerLevel + room, depths[nextFirstRoom + numberOfRoomsPerLevel + room]) for room in range(0, numberOfRoomsPerLevel)]
+				firstLevelNumber += numberOfBandLevels - 2
+
+			if self.numberOfTargetsWritten != numberOfConnections:
+				raise Exception('StreamingLabyrinthGenerator.Generate(): The labyrinth is not a single tree.')
+
+			self.reporter.Report('singleBlob', "The labyrinth is a single blob.")
+			self.reporter.Report('pathToGoal', "The path from Room (0, 0) to the goal contains " + str(self.goalDepth + 1) + " rooms.",
+				numberOfRooms = self.goalDepth + 1)
+			self.PlaceBooksInRooms()
+
+			outputFile.seek(self.targetsPosition + 4 * numberOfConnections)
+
+			for room, book in sorted(self.booksInRooms.items()):
+				title = book.encode('utf-8')
+				outputFile.write(LabyrinthFile.PadToFourBytes(LabyrinthFile.bookHeader.pack(room, len(title)) + title))
+
+			outputFile.truncate()
+			outputFile.seek(0)
+			outputFile.write(LabyrinthFile.header.pack(LabyrinthFile.magicNumber, LabyrinthFile.formatVersion, self.numberOfLevels, numberOfRoomsPerLevel,
+				LabyrinthFile.seedFlag, self.roomGoal, numberOfConnections, len(self.booksInRooms), self.seed))
+
+		self.reporter.Report('summary', None, numberOfAttemptsToRefactor = self.numberOfAttemptsToRefactor, conflictCounts = list(self.conflictCounts))
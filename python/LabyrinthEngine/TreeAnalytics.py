@@ -0,0 +1,134 @@
+# TreeAnalytics.py
+
+# Facts about the shape of a labyrinth whose connections form a tree, computed once and then shared by every query:
+#   the depth of each room (its distance from the root, room (0, 0)), the height of each room (the length of the longest path down
+#   into its subtree), the eccentricity of each room (its distance from the room farthest from it), and the diameter (the longest path
+#   in the labyrinth): its length, its two ends and the path itself.
+
+# Everything is derived from the parents and depths recorded by a DistanceOracle, without a search of the connections:
+# the rooms are sorted by depth (a counting sort), the heights are then computed from the leaves up, and the eccentricities from the root down.
+# Each pass is a plain loop over preallocated arrays, so nothing is allocated per room.
+# In a tree, the room farthest from any room is one of the two ends of the diameter, so FindFarthestRoom() costs two distance queries.
+# The order, heights, eccentricities and diameter path may also be passed in (e.g. as computed by NumpyLabyrinth), in which case they are used as they are.
+
+from array import array
+
+class TreeAnalytics:
+	def __init__(self, distanceOracle, analyticsArrays = None):
+
+		if not distanceOracle.isTree:
+			raise Exception('TreeAnalytics.__init__(): The connections do not form a tree.')
+
+		self.distanceOracle = distanceOracle
+		self.root = distanceOracle.root
+		self.depths = distanceOracle.depths
+
+		if analyticsArrays != None:
+			self.order, self.heights, self.eccentricities, self.diameterPath = analyticsArrays
+		else:
+			self.Compute()
+
+		self.diameter = len(self.diameterPath) - 1
+		self.diameterEnds = (self.diameterPath[0], self.diameterPath[self.diameter])
+
+	def Compute(self):
+		parents = self.distanceOracle.parents
+		depths = self.depths
+		numberOfRooms = len(parents)
+		root = self.root
+		self.order = array('i', [0]) * numberOfRooms	# The rooms, in order of depth; each parent comes before its children.
+		self.heights = array('i', [0]) * numberOfRooms
+		self.eccentricities = array('i', [0]) * numberOfRooms
+
+		# Sort the rooms by depth.
+		order = self.order
+		maximumDepth = max(depths)
+		starts = array('i', [0]) * (maximumDepth + 2)	# starts[depth + 1] counts, then locates, the rooms at the given depth.
+
+		for room in range(0, numberOfRooms):
+			starts[depths[room] + 1] += 1
+
+		for depth in range(1, maximumDepth + 2):
+			starts[depth] += starts[depth - 1]
+
+		for room in range(0, numberOfRooms):
+			depth = depths[room]
+			order[starts[depth]] = room
+			starts[depth] += 1
+
+		# From the leaves up: the height of each room, and the child through which it is reached (-1 for a leaf).
+		# secondHeights records, for each room, the longest path down through any other child (or 0).
+		heights = self.heights
+		secondHeights = array('i', [0]) * numberOfRooms
+		tallestChildren = array('i', [-1]) * numberOfRooms
+		secondTallestChildren = array('i', [-1]) * numberOfRooms
+
+		for index in range(numberOfRooms - 1, 0, -1):
+			room = order[index]
+			parent = parents[room]
+			height = heights[room] + 1
+
+			if height > heights[parent]:
+				secondHeights[parent] = heights[parent]
+				secondTallestChildren[parent] = tallestChildren[parent]
+				heights[parent] = height
+				tallestChildren[parent] = room
+			elif height > secondHeights[parent]:
+				secondHeights[parent] = height
+				secondTallestChildren[parent] = room
+
+		# The diameter turns at the room where the two longest paths down through different children are longest together.
+		diameterPeak = root
+
+		for room in range(0, numberOfRooms):
+
+			if heights[room] + secondHeights[room] > heights[diameterPeak] + secondHeights[diameterPeak]:
+				diameterPeak = room
+
+		self.diameterPath = array('i', [0]) * (heights[diameterPeak] + secondHeights[diameterPeak] + 1)	# From diameterEnds[0] to diameterEnds[1].
+		diameterPath = self.diameterPath
+		index = heights[diameterPeak]
+		room = diameterPeak
+
+		while room >= 0:	# Down the tallest branch, filling the first part of the path backwards.
+			diameterPath[index] = room
+			index -= 1
+			room = tallestChildren[room]
+
+		index = heights[diameterPeak] + 1
+		room = secondTallestChildren[diameterPeak]
+
+		while room >= 0:	# Down the second tallest branch, if there is one.
+			diameterPath[index] = room
+			index += 1
+			room = tallestChildren[room]
+
+		# From the root down: the length of the longest path that leaves each room through its parent, and so the eccentricity of each room.
+		eccentricities = self.eccentricities
+		upHeights = array('i', [0]) * numberOfRooms
+		eccentricities[root] = heights[root]
+
+		for index in range(1, numberOfRooms):
+			room = order[index]
+			parent = parents[room]
+
+			if room == tallestChildren[parent]:
+				siblingHeight = secondHeights[parent]
+			else:
+				siblingHeight = heights[parent]
+
+			upHeights[room] = max(upHeights[parent], siblingHeight) + 1
+			eccentricities[room] = max(heights[room], upHeights[room])
+
+	def IsUpToDate(self):
+		return self.distanceOracle.IsUpToDate()
+
+	def FindFarthestRoom(self, room):
+		# Return a (farthestRoom, distance) tuple.
+		end1, end2 = self.diameterEnds
+		distance = self.eccentricities[room]
+
+		if self.distanceOracle.Distance(room, end1) == distance:
+			return (end1, distance)
+
+		return (end2, distance)
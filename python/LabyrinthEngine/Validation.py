@@ -0,0 +1,316 @@
+# Validation.py
+
+# Checks that generated labyrinths obey the rules, independently of the code that generated them, and checks the data structures
+# that the generators rely on.  Each check raises an exception at the first thing that is wrong.
+
+# CheckLabyrinth() checks a labyrinth from any engine (LabyrinthGenerator, NumpyLabyrinthGenerator, or a file written by
+# StreamingLabyrinthGenerator): every connection is symmetric and joins two possible neighbours, no connection conflicts with another,
+# the rooms form a single blob with numberOfRooms - 1 connections (plus any extra connections), the goal is at the end of a path
+# from the room (0, 0) that is as long as any, and the DistanceOracle agrees with a breadth-first search.
+# The conflict rule is tested in the terms of NumpyLabyrinth: a connection must not coexist with its partner (the connection between
+# the same two room numbers, the other way round) in the same gap between levels, or in the gap below or above it.
+
+# The other checks are:
+#   CheckDisjointSet(): random unions, detachments and compactions of a DisjointSet, against a brute-force partition;
+#   CheckSlots(): every pair of possible neighbours has exactly one slot, and (if NumPy is installed) NumpyLabyrinthGenerator.FindConflicts()
+#   agrees with LabyrinthGenerator.FindConflictingConnections() for every slot;
+#   CheckFrontier(): whenever LabyrinthGenerator refactors, every pair of possible neighbours in different blobs is in the frontier.
+
+# Usage: python3 -m LabyrinthEngine.Validation [--engine python|numpy|streaming|all] [--sizes 15x7,30x30] [--seeds 0,1,2]
+#   [--extra-connections 0] [--levels-per-band 4]
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from . import LabyrinthFile
+from . import PathFinding
+from .DisjointSet import DisjointSet
+from .Labyrinth import LabyrinthGenerator
+from .PossibleNeighbours import GetPossibleNeighbourTable
+from .Reporting import QuietReporter
+from .StreamingGeneration import StreamingLabyrinthGenerator
+
+engines = ['python', 'numpy', 'streaming']
+numberOfDistanceQueries = 100
+
+def IsNumpyInstalled():
+
+	try:
+		import numpy
+		return True
+	except ImportError:
+		return False
+
+def CheckLabyrinth(labyrinth, numberOfExtraConnections = 0, checkRandom = None):
+
+	if checkRandom == None:
+		checkRandom = random.Random(0)
+
+	numberOfRoomsPerLevel = labyrinth.numberOfRoomsPerLevel
+	numberOfRooms = labyrinth.numberOfRooms
+	possibleNeighbours = GetPossibleNeighbourTable(labyrinth.numberOfLevels, numberOfRoomsPerLevel)
+	connections = set()
+
+	for room in range(0, numberOfRooms):
+
+		for otherRoom in labyrinth.connections.Neighbours(room):
+
+			if not room in labyrinth.connections.Neighbours(otherRoom):
+				raise Exception('Validation.CheckLabyrinth(): The connection from ' + labyrinth.RoomToString(room) + ' to ' +
+					labyrinth.RoomToString(otherRoom) + ' is not symmetric.')
+
+			if not otherRoom in possibleNeighbours.Get(room):
+				raise Exception('Validation.CheckLabyrinth(): ' + labyrinth.RoomToString(room) + ' and ' + labyrinth.RoomToString(otherRoom) +
+					' are connected, but are not possible neighbours.')
+
+			connections.add((min(room, otherRoom), max(room, otherRoom)))
+
+	if len(connections) != numberOfRooms - 1 + numberOfExtraConnections:
+		raise Exception('Validation.CheckLabyrinth(): There are ' + str(len(connections)) + ' connections; expected ' +
+			str(numberOfRooms - 1 + numberOfExtraConnections) + '.')
+
+	for lowerRoom, upperRoom in connections:
+		levelNumber, lowerRoomNumber = divmod(lowerRoom, numberOfRoomsPerLevel)
+		upperRoomNumber = upperRoom % numberOfRoomsPerLevel
+
+		# The partner of the connection, in the gap below, in the same gap, and in the gap above (the conflicts of Types 2, 1 and 3).
+		for partnerLevelNumber in range(levelNumber - 1, levelNumber + 2):
+			partner = (partnerLevelNumber * numberOfRoomsPerLevel + upperRoomNumber, (partnerLevelNumber + 1) * numberOfRoomsPerLevel + lowerRoomNumber)
+
+			if partner in connections:
+				raise Exception('Validation.CheckLabyrinth(): The connection from ' + labyrinth.RoomToString(lowerRoom) + ' to ' +
+					labyrinth.RoomToString(upperRoom) + ' conflicts with the connection from ' + labyrinth.RoomToString(partner[0]) + ' to ' +
+					labyrinth.RoomToString(partner[1]) + '.')
+
+	# The blobs are rebuilt from the connections alone.
+	blobs = DisjointSet(numberOfRooms)
+
+	for room, otherRoom in connections:
+		blobs.Union(room, otherRoom)
+
+	if blobs.numberOfSets != 1:
+		raise Exception('Validation.CheckLabyrinth(): The labyrinth is in ' + str(blobs.numberOfSets) + ' blobs.')
+
+	farthestRoom, farthestDistance = PathFinding.FindFarthestRoom(labyrinth.connections, 0)
+
+	if numberOfExtraConnections == 0 and PathFinding.FindDistance(labyrinth.connections, 0, labyrinth.roomGoal) != farthestDistance:
+		raise Exception('Validation.CheckLabyrinth(): The goal is not as far from the room (0, 0) as ' + labyrinth.RoomToString(farthestRoom) + '.')
+
+	if labyrinth.booksInRooms.get(labyrinth.roomGoal) != labyrinth.goalBook:
+		raise Exception('Validation.CheckLabyrinth(): The goal book is not in the goal room.')
+
+	distanceOracle = labyrinth.GetDistanceOracle()
+
+	for i in range(0, numberOfDistanceQueries):
+		room1 = checkRandom.randrange(numberOfRooms)
+		room2 = checkRandom.randrange(numberOfRooms)
+
+		if distanceOracle.Distance(room1, room2) != PathFinding.FindDistance(labyrinth.connections, room1, room2):
+			raise Exception('Validation.CheckLabyrinth(): The distance oracle is wrong about the distance from ' + labyrinth.RoomToString(room1) +
+				' to ' + labyrinth.RoomToString(room2) + '.')
+
+def CheckDisjointSet(numberOfItems, numberOfOperations, checkRandom):
+	# setNumbers is the brute-force partition: it maps each item to the number of its set.
+	disjointSet = DisjointSet(numberOfItems)
+	setNumbers = list(range(0, numberOfItems))
+	nextSetNumber = numberOfItems
+
+	for i in range(0, numberOfOperations):
+		operation = checkRandom.randrange(10)
+
+		if operation < 6:
+			item1 = checkRandom.randrange(numberOfItems)
+			item2 = checkRandom.randrange(numberOfItems)
+			oldSetNumber = setNumbers[item2]
+			wereSeparate = setNumbers[item1] != oldSetNumber
+
+			if disjointSet.Union(item1, item2) != wereSeparate:
+				raise Exception('Validation.CheckDisjointSet(): Union() returned the wrong result.')
+
+			for item in range(0, numberOfItems):
+
+				if setNumbers[item] == oldSetNumber:
+					setNumbers[item] = setNumbers[item1]
+		elif operation < 9:
+			# Detach some of the items in the set of a random item.
+			setNumber = setNumbers[checkRandom.randrange(numberOfItems)]
+			items = [item for item in range(0, numberOfItems) if setNumbers[item] == setNumber]
+			items = checkRandom.sample(items, checkRandom.randint(1, len(items)))
+			root = disjointSet.Detach(items)
+
+			if root != disjointSet.Find(items[0]):
+				raise Exception('Validation.CheckDisjointSet(): Detach() did not return the root of the new set.')
+
+			for item in items:
+				setNumbers[item] = nextSetNumber
+
+			nextSetNumber += 1
+		else:
+			disjointSet.Compact()
+
+		if disjointSet.numberOfSets != len(set(setNumbers)):
+			raise Exception('Validation.CheckDisjointSet(): numberOfSets is ' + str(disjointSet.numberOfSets) + '; expected ' + str(len(set(setNumbers))) + '.')
+
+		rootsBySetNumber = {}
+
+		for item in range(0, numberOfItems):
+			root = disjointSet.Find(item)
+
+			if rootsBySetNumber.setdefault(setNumbers[item], root) != root:
+				raise Exception('Validation.CheckDisjointSet(): Two items in the same set have different roots.')
+
+			if disjointSet.Size(item) != setNumbers.count(setNumbers[item]):
+				raise Exception('Validation.CheckDisjointSet(): The size of the set of item ' + str(item) + ' is wrong.')
+
+		if len(set(rootsBySetNumber.values())) != len(rootsBySetNumber):
+			raise Exception('Validation.CheckDisjointSet(): Two different sets have the same root.')
+
+def CheckSlots(numberOfLevels, numberOfRoomsPerLevel, checkRandom):
+	possibleNeighbours = GetPossibleNeighbourTable(numberOfLevels, numberOfRoomsPerLevel)
+	pairs = set()
+
+	for room in range(0, numberOfLevels * numberOfRoomsPerLevel):
+
+		for otherRoom in possibleNeighbours.Get(room):
+
+			if room < otherRoom:
+				pairs.add((room, otherRoom))
+
+	slots = [possibleNeighbours.GetSlot(slot) for slot in range(0, possibleNeighbours.numberOfSlots)]
+
+	if len(set(slots)) != len(slots) or set(slots) != pairs:
+		raise Exception('Validation.CheckSlots(): The slots are not the pairs of possible neighbours, each exactly once.')
+
+	if not IsNumpyInstalled():
+		return
+
+	from .NumpyLabyrinth import NumpyLabyrinthGenerator	# Imported only when it is used, since NumPy is optional.
+
+	# Connect a random third of the slots in both generators, and compare the conflicts that each of them finds in every slot.
+	numpyGenerator = NumpyLabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, QuietReporter(), 0)
+	generator = LabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, QuietReporter(), 0)
+
+	for slot in range(0, len(slots)):
+
+		if checkRandom.randrange(3) == 0:
+			numpyGenerator.connected[slot] = True
+			generator.connections.Connect(*slots[slot])
+
+	conflicts = numpyGenerator.FindConflicts()
+
+	for slot in range(0, len(slots)):
+		room1, room2 = slots[slot]
+
+		if (numpyGenerator.lowerRooms[slot], numpyGenerator.upperRooms[slot]) != slots[slot]:
+			raise Exception('Validation.CheckSlots(): NumpyLabyrinthGenerator numbers slot ' + str(slot) + ' differently.')
+
+		if bool(conflicts[slot]) != generator.FindConflictingConnections(room1, room2):
+			raise Exception('Validation.CheckSlots(): The conflict tests disagree about slot ' + str(slot) + '.')
+
+def CheckFrontier(generator):
+	# Wrap the generator's Refactor() on the instance itself (as GenerationStats does), to check the frontier each time that it is called.
+	refactor = generator.Refactor
+
+	def CheckedRefactor():
+		frontierPairs = set()
+
+		for index in range(0, len(generator.frontier), 2):
+			room1 = generator.frontier[index]
+			room2 = generator.frontier[index + 1]
+			frontierPairs.add((min(room1, room2), max(room1, room2)))
+
+		for room1 in generator.rooms:
+
+			for room2 in generator.GeneratePossibleNeighbours(room1):
+
+				if room1 < room2 and generator.roomLabels.Find(room1) != generator.roomLabels.Find(room2) and not (room1, room2) in frontierPairs:
+					raise Exception('Validation.CheckFrontier(): ' + generator.RoomToString(room1) + ' and ' + generator.RoomToString(room2) +
+						' are in different blobs, but are not in the frontier.')
+
+		refactor()
+
+	generator.Refactor = CheckedRefactor
+
+def Validate(engine, numberOfLevels, numberOfRoomsPerLevel, seed, numberOfExtraConnections = 0, levelsPerBand = 4):
+	# Generate a labyrinth with the given engine and check it; return the number of times that it was refactored.
+	checkRandom = random.Random(seed)
+
+	if engine == 'streaming':
+		fileDescriptor, path = tempfile.mkstemp(suffix = '.lbyr')
+		os.close(fileDescriptor)
+
+		try:
+			generator = StreamingLabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, path, QuietReporter(), seed, levelsPerBand)
+			generator.Generate()
+			labyrinth = LabyrinthFile.LoadLabyrinth(path)
+
+			try:
+				CheckLabyrinth(labyrinth, 0, checkRandom)
+			finally:
+				labyrinth.Close()
+		finally:
+			os.remove(path)
+
+		return generator.numberOfAttemptsToRefactor
+
+	if engine == 'numpy':
+		from .NumpyLabyrinth import NumpyLabyrinthGenerator	# Imported only when it is used, since NumPy is optional.
+		generator = NumpyLabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, QuietReporter(), seed)
+		generator.Generate()
+		CheckLabyrinth(generator, 0, checkRandom)
+		return generator.numberOfAttemptsToRefactor
+
+	generator = LabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, QuietReporter(), seed, numberOfExtraConnections = numberOfExtraConnections)
+	CheckFrontier(generator)
+	generator.Generate()
+	CheckLabyrinth(generator, generator.numberOfExtraConnectionsAdded, checkRandom)
+	return generator.numberOfAttemptsToRefactor
+
+def ParseSizes(text):
+	sizes = []
+
+	for size in text.split(','):
+		numberOfLevels, numberOfRoomsPerLevel = size.split('x')
+		sizes.append((int(numberOfLevels), int(numberOfRoomsPerLevel)))
+
+	return sizes
+
+def main():
+	parser = argparse.ArgumentParser(description = 'Check that generated labyrinths obey the rules, and check the data structures behind the generators.')
+	parser.add_argument('--engine', choices = engines + ['all'], default = 'all', help = 'the generator to check (default: all; numpy is skipped if NumPy is not installed)')
+	parser.add_argument('--sizes', type = ParseSizes, default = [(3, 4), (5, 4), (15, 7), (30, 30)], help = 'comma-separated LEVELSxROOMS sizes (default: 3x4,5x4,15x7,30x30)')
+	parser.add_argument('--seeds', type = lambda text: [int(seed) for seed in text.split(',')], default = [0, 1, 2], help = 'comma-separated seeds (default: 0,1,2)')
+	parser.add_argument('--extra-connections', type = int, default = 0, help = 'the number of extra connections to ask the python engine for (default: 0)')
+	parser.add_argument('--levels-per-band', type = int, default = 4, help = 'the number of levels per band for the streaming engine (default: 4)')
+	args = parser.parse_args()
+
+	selectedEngines = [args.engine]
+
+	if args.engine == 'all':
+		selectedEngines = engines
+
+		if not IsNumpyInstalled():
+			sys.stderr.write('NumPy is not installed; the numpy engine is skipped.\n')
+			selectedEngines = ['python', 'streaming']
+
+	for seed in args.seeds:
+		CheckDisjointSet(50, 500, random.Random(seed))
+
+	sys.stderr.write('DisjointSet: ok\n')
+
+	for numberOfLevels, numberOfRoomsPerLevel in args.sizes:
+		CheckSlots(numberOfLevels, numberOfRoomsPerLevel, random.Random(numberOfLevels * numberOfRoomsPerLevel))
+
+		for engine in selectedEngines:
+			numberOfAttemptsToRefactor = 0
+
+			for seed in args.seeds:
+				numberOfAttemptsToRefactor += Validate(engine, numberOfLevels, numberOfRoomsPerLevel, seed, args.extra_connections, args.levels_per_band)
+
+			sys.stderr.write(engine + ' ' + str(numberOfLevels) + 'x' + str(numberOfRoomsPerLevel) + ': ok (' + str(len(args.seeds)) + ' seed(s), ' +
+				str(numberOfAttemptsToRefactor) + ' refactoring(s))\n')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,15 @@
+# LabyrinthEngine
+
+# The labyrinth generator, and everything needed to navigate, save and load labyrinths.
+# Importing the package has no side effects.  The interactive game is Labyrinth.py, outside of the package;
+# "python3 -m LabyrinthEngine" generates a labyrinth from the command line (see __main__.py).
+# BatchGeneration, Benchmarks, JorgeSimulation, LabyrinthCache, NavigationServer, NumpyLabyrinth and Validation are not imported here, since they are run
+# as scripts ("python3 -m LabyrinthEngine.Validation"), or need modules that the engine itself does not (JorgeSimulation and NumpyLabyrinth need NumPy).
+
+from .GenerationStats import GenerationStats
+from .Labyrinth import RoomInfo, LabyrinthBase, LabyrinthGenerator
+from .LabyrinthExport import GenerateRecords, ExportLabyrinth
+from .LabyrinthFile import SerializeLabyrinth, SaveLabyrinth, LoadLabyrinth, MappedLabyrinth, LabyrinthToDictionary
+from .NavigationSession import NavigationSession
+from .Reporting import ConsoleReporter, QuietReporter, LoggingReporter, EventReporter
+from .StreamingGeneration import StreamingLabyrinthGenerator
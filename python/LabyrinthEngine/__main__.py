@@ -0,0 +1,130 @@
+# __main__.py
+
+# Generates one labyrinth, without any interaction, and writes it out:
+#   text: the generator's report (every connection, the refactorings, and the lengths of the longest path and of the path to the goal);
+#   json: the labyrinth as JSON (see LabyrinthFile.LabyrinthToDictionary);
+#   binary: a labyrinth file (see LabyrinthFile); --output is required;
+#   jsonl, csv, dot: a stream of records, written as they are generated (see LabyrinthExport).
+# The numpy engine (NumpyLabyrinth.NumpyLabyrinthGenerator) is much faster for large labyrinths, but needs NumPy.
+# The streaming engine (StreamingGeneration.StreamingLabyrinthGenerator) writes the labyrinth to a labyrinth file a band of levels at a time,
+# so it can generate labyrinths that do not fit in memory; it needs the binary format.
+# If no seed is given, one is chosen at random; it is recorded in the JSON and binary forms, so the labyrinth can be generated again.
+# --extra-connections adds up to that many connections to the finished labyrinth, to make loops; it needs the python engine.
+# --stats writes the generator's counters and per-phase times (see GenerationStats) to standard error, as JSON; it needs the python engine.
+# --profile runs everything under cProfile, and either writes the 25 most expensive functions (by cumulative time) to standard error,
+# or, if a path is given, saves the profile there (for pstats or snakeviz).
+
+# Usage: python3 -m LabyrinthEngine [--levels 15] [--rooms 7] [--seed 42] [--format text|json|binary|jsonl|csv|dot] [--output path]
+#   [--engine python|numpy|streaming] [--levels-per-band 64] [--extra-connections 0] [--stats] [--profile [path]]
+
+import argparse
+import contextlib
+import json
+import sys
+from . import LabyrinthExport
+from . import LabyrinthFile
+from .GenerationStats import GenerationStats
+from .Labyrinth import LabyrinthGenerator, NewSeed
+from .Reporting import ConsoleReporter, QuietReporter
+from .StreamingGeneration import StreamingLabyrinthGenerator
+
+def CreateGenerator(engine, numberOfLevels, numberOfRoomsPerLevel, seed, reporter, stats = None, numberOfExtraConnections = 0):
+
+	if engine == 'numpy':
+		from .NumpyLabyrinth import NumpyLabyrinthGenerator	# Imported only when it is used, since NumPy is optional.
+		return NumpyLabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, reporter, seed)
+
+	return LabyrinthGenerator(numberOfLevels, numberOfRoomsPerLevel, reporter, seed, stats, numberOfExtraConnections)
+
+def GenerateAndWrite(args, seed, stats):
+
+	if args.engine == 'streaming':
+		StreamingLabyrinthGenerator(args.levels, args.rooms, args.output, QuietReporter(), seed, args.levels_per_band).Generate()
+		return
+
+	if args.format == 'text':
+
+		if args.output != None:
+
+			with open(args.output, 'w') as outputFile, contextlib.redirect_stdout(outputFile):
+				CreateGenerator(args.engine, args.levels, args.rooms, seed, ConsoleReporter(), stats, args.extra_connections).Generate()
+		else:
+			CreateGenerator(args.engine, args.levels, args.rooms, seed, ConsoleReporter(), stats, args.extra_connections).Generate()
+
+		return
+
+	generator = CreateGenerator(args.engine, args.levels, args.rooms, seed, QuietReporter(), stats, args.extra_connections)
+	generator.Generate()
+
+	if args.format == 'binary':
+		LabyrinthFile.SaveLabyrinth(generator, args.output, seed)
+	elif args.format in LabyrinthExport.writers:
+
+		if args.output != None:
+
+			with open(args.output, 'w', newline = '') as outputFile:
+				LabyrinthExport.ExportLabyrinth(generator, outputFile, args.format, seed)
+		else:
+			LabyrinthExport.ExportLabyrinth(generator, sys.stdout, args.format, seed)
+	elif args.output != None:
+
+		with open(args.output, 'w') as outputFile:
+			json.dump(LabyrinthFile.LabyrinthToDictionary(generator, seed), outputFile)
+			outputFile.write('\n')
+	else:
+		sys.stdout.write(json.dumps(LabyrinthFile.LabyrinthToDictionary(generator, seed)) + '\n')
+
+def main():
+	parser = argparse.ArgumentParser(prog = 'python3 -m LabyrinthEngine', description = 'Generate a labyrinth without any interaction.')
+	parser.add_argument('--levels', type = int, default = 15, help = 'the number of levels')
+	parser.add_argument('--rooms', type = int, default = 7, help = 'the number of rooms per level')
+	parser.add_argument('--seed', type = int, default = None, help = 'the seed for the random number generator (default: a random seed)')
+	parser.add_argument('--format', choices = ['text', 'json', 'binary', 'jsonl', 'csv', 'dot'], default = 'text', help = 'the output format (default: text)')
+	parser.add_argument('--output', default = None, help = 'the file to write (default: standard output)')
+	parser.add_argument('--engine', choices = ['python', 'numpy', 'streaming'], default = 'python', help = 'the generator to use (default: python)')
+	parser.add_argument('--levels-per-band', type = int, default = 64, help = 'the number of levels generated at a time by the streaming engine (default: 64)')
+	parser.add_argument('--extra-connections', type = int, default = 0, help = 'the number of extra connections to add, to make loops (default: 0)')
+	parser.add_argument('--stats', action = 'store_true', help = 'write the generator\'s counters and per-phase times to standard error')
+	parser.add_argument('--profile', nargs = '?', const = '-', default = None, metavar = 'PATH', help = 'run under cProfile, and write a summary to standard error, or the profile to PATH')
+	args = parser.parse_args()
+
+	if args.format == 'binary' and args.output == None:
+		parser.error('the binary format requires --output')
+
+	if args.engine == 'streaming' and args.format != 'binary':
+		parser.error('the streaming engine requires the binary format')
+
+	if args.stats and args.engine != 'python':
+		parser.error('--stats requires the python engine')
+
+	if args.extra_connections > 0 and args.engine != 'python':
+		parser.error('--extra-connections requires the python engine')
+
+	seed = args.seed
+
+	if seed == None:
+		seed = NewSeed()
+
+	stats = None
+
+	if args.stats:
+		stats = GenerationStats()
+
+	if args.profile == None:
+		GenerateAndWrite(args, seed, stats)
+	else:
+		import cProfile	# Imported only when it is used.
+		import pstats
+		profile = cProfile.Profile()
+		profile.runcall(GenerateAndWrite, args, seed, stats)
+
+		if args.profile == '-':
+			pstats.Stats(profile, stream = sys.stderr).sort_stats('cumulative').print_stats(25)
+		else:
+			profile.dump_stats(args.profile)
+
+	if stats != None:
+		sys.stderr.write(json.dumps(stats.ToDictionary()) + '\n')
+
+if __name__ == '__main__':
+	main()